@@ -1,7 +1,7 @@
 """JWT token handling for cabinet authentication."""
 
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, NotRequired, TypedDict
 
 import jwt
 
@@ -11,6 +11,16 @@ from app.config import settings
 JWT_ALGORITHM = 'HS256'
 
 
+class TokenPayload(TypedDict):
+    """Validated token claims; ``sub`` is already parsed to the database user ID."""
+
+    sub: int
+    type: str
+    exp: int
+    iat: int
+    telegram_id: NotRequired[int]
+
+
 def create_access_token(user_id: int, telegram_id: int | None = None) -> str:
     """
     Create a short-lived access token.
@@ -83,16 +93,16 @@ def decode_token(token: str) -> dict[str, Any] | None:
         return None
 
 
-def get_token_payload(token: str, expected_type: str = 'access') -> dict[str, Any] | None:
+def get_token_payload(token: str, expected_type: str = 'access') -> TokenPayload | None:
     """
-    Decode token and verify its type.
+    Decode token, verify its type and parse the subject claim.
 
     Args:
         token: JWT token string
         expected_type: Expected token type ("access" or "refresh")
 
     Returns:
-        Decoded payload dict or None if invalid/expired/wrong type
+        Payload with ``sub`` as int, or None if invalid/expired/wrong type/malformed subject
     """
     payload = decode_token(token)
 
@@ -102,7 +112,12 @@ def get_token_payload(token: str, expected_type: str = 'access') -> dict[str, An
     if payload.get('type') != expected_type:
         return None
 
-    return payload
+    sub = payload.get('sub')
+    if not isinstance(sub, str) or not sub.isdecimal():
+        return None
+    payload['sub'] = int(sub)
+
+    return payload  # type: ignore[return-value]
 
 
 def get_refresh_token_expires_at() -> datetime:
@@ -1,10 +1,15 @@
 """OAuth 2.0 provider implementations for cabinet authentication."""
 
+import asyncio
+import base64
 import secrets
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, TypedDict
+from urllib.parse import quote, urlencode
 
 import httpx
+import orjson
 import structlog
 from pydantic import BaseModel
 
@@ -16,6 +21,30 @@ logger = structlog.get_logger(__name__)
 
 STATE_TTL_SECONDS = 600  # 10 minutes
 
+# Shared HTTP/2 client: keeps TLS connections to provider hosts alive between requests,
+# so the token exchange and userinfo calls to the same origin multiplex on one connection
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or lazily create the pooled HTTP client for provider API calls."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled HTTP client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 # --- Typed dicts for provider API responses ---
 
@@ -82,7 +111,11 @@ class VKUserInfoResponse(TypedDict, total=False):
 
 
 class OAuthUserInfo(BaseModel):
-    """Normalized user info from OAuth provider."""
+    """Normalized user info from OAuth provider.
+
+    Providers build it via ``model_construct``: fields are already normalized
+    from the provider payload, so validation is skipped.
+    """
 
     provider: str
     provider_id: str
@@ -99,21 +132,18 @@ class OAuthUserInfo(BaseModel):
 
 async def generate_oauth_state(provider: str) -> str:
     """Generate a CSRF state token for OAuth flow. Stored in Redis with TTL."""
-    state = secrets.token_urlsafe(32)
-    await cache.set(cache_key('oauth_state', state), provider, expire=STATE_TTL_SECONDS)
+    # 24 random bytes encode to exactly 32 url-safe base64 chars, no padding to strip
+    state = base64.urlsafe_b64encode(secrets.token_bytes(24)).decode('ascii')
+    await cache.setnx(cache_key('oauth_state', state), provider, expire=STATE_TTL_SECONDS)
     return state
 
 
 async def validate_oauth_state(state: str, provider: str) -> bool:
     """Validate and consume a CSRF state token from Redis."""
-    key = cache_key('oauth_state', state)
-    stored_provider: str | None = await cache.get(key)
+    stored_provider: str | None = await cache.getdel(cache_key('oauth_state', state))
     if stored_provider is None:
         return False
-    await cache.delete(key)
-    if stored_provider != provider:
-        return False
-    return True
+    return stored_provider == provider
 
 
 # --- Provider implementations ---
@@ -124,12 +154,22 @@ class OAuthProvider(ABC):
 
     name: str
     display_name: str
+    TOKEN_URL: str
+
+    _semaphore: asyncio.Semaphore | None = None
 
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
 
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """Get the per-provider semaphore bounding concurrent outbound calls."""
+        if cls.__dict__.get('_semaphore') is None:
+            cls._semaphore = asyncio.Semaphore(max(1, settings.OAUTH_MAX_CONCURRENT_REQUESTS))
+        return cls._semaphore
+
     @abstractmethod
     def get_authorization_url(self, state: str) -> str:
         """Build the authorization URL for the provider."""
@@ -161,11 +201,11 @@ class GoogleProvider(OAuthProvider):
             'access_type': 'offline',
             'prompt': 'select_account',
         }
-        request = httpx.Request('GET', self.AUTHORIZE_URL, params=params)
-        return str(request.url)
+        return f'{self.AUTHORIZE_URL}?{urlencode(params, quote_via=quote)}'
 
     async def exchange_code(self, code: str) -> OAuthTokenResponse:
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.post(
                 self.TOKEN_URL,
                 json={
@@ -176,25 +216,26 @@ class GoogleProvider(OAuthProvider):
                     'redirect_uri': self.redirect_uri,
                 },
             )
-            response.raise_for_status()
-            data: OAuthTokenResponse = response.json()
-            return data
+        response.raise_for_status()
+        data: OAuthTokenResponse = orjson.loads(response.content)
+        return data
 
     async def get_user_info(self, token_data: OAuthTokenResponse) -> OAuthUserInfo:
         access_token = token_data['access_token']
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.get(
                 self.USERINFO_URL,
                 headers={'Authorization': f'Bearer {access_token}'},
             )
-            response.raise_for_status()
-            data: GoogleUserInfoResponse = response.json()
+        response.raise_for_status()
+        data: GoogleUserInfoResponse = orjson.loads(response.content)
 
-        return OAuthUserInfo(
+        return OAuthUserInfo.model_construct(
             provider='google',
             provider_id=str(data['sub']),
             email=data.get('email'),
-            email_verified=data.get('email_verified', False),
+            email_verified=data.get('email_verified') is True,
             first_name=data.get('given_name'),
             last_name=data.get('family_name'),
             avatar_url=data.get('picture'),
@@ -218,11 +259,11 @@ class YandexProvider(OAuthProvider):
             'state': state,
             'force_confirm': 'yes',
         }
-        request = httpx.Request('GET', self.AUTHORIZE_URL, params=params)
-        return str(request.url)
+        return f'{self.AUTHORIZE_URL}?{urlencode(params, quote_via=quote)}'
 
     async def exchange_code(self, code: str) -> OAuthTokenResponse:
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.post(
                 self.TOKEN_URL,
                 data={
@@ -232,26 +273,27 @@ class YandexProvider(OAuthProvider):
                     'grant_type': 'authorization_code',
                 },
             )
-            response.raise_for_status()
-            data: OAuthTokenResponse = response.json()
-            return data
+        response.raise_for_status()
+        data: OAuthTokenResponse = orjson.loads(response.content)
+        return data
 
     async def get_user_info(self, token_data: OAuthTokenResponse) -> OAuthUserInfo:
         access_token = token_data['access_token']
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.get(
                 self.USERINFO_URL,
                 params={'format': 'json'},
                 headers={'Authorization': f'OAuth {access_token}'},
             )
-            response.raise_for_status()
-            data: YandexUserInfoResponse = response.json()
+        response.raise_for_status()
+        data: YandexUserInfoResponse = orjson.loads(response.content)
 
         default_email = data.get('default_email')
         emails = data.get('emails', [])
         email = default_email or (emails[0] if emails else None)
 
-        return OAuthUserInfo(
+        return OAuthUserInfo.model_construct(
             provider='yandex',
             provider_id=str(data['id']),
             email=email,
@@ -284,11 +326,11 @@ class DiscordProvider(OAuthProvider):
             'state': state,
             'prompt': 'consent',
         }
-        request = httpx.Request('GET', self.AUTHORIZE_URL, params=params)
-        return str(request.url)
+        return f'{self.AUTHORIZE_URL}?{urlencode(params, quote_via=quote)}'
 
     async def exchange_code(self, code: str) -> OAuthTokenResponse:
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.post(
                 self.TOKEN_URL,
                 data={
@@ -299,29 +341,30 @@ class DiscordProvider(OAuthProvider):
                     'redirect_uri': self.redirect_uri,
                 },
             )
-            response.raise_for_status()
-            data: OAuthTokenResponse = response.json()
-            return data
+        response.raise_for_status()
+        data: OAuthTokenResponse = orjson.loads(response.content)
+        return data
 
     async def get_user_info(self, token_data: OAuthTokenResponse) -> OAuthUserInfo:
         access_token = token_data['access_token']
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.get(
                 self.USERINFO_URL,
                 headers={'Authorization': f'Bearer {access_token}'},
             )
-            response.raise_for_status()
-            data: DiscordUserInfoResponse = response.json()
+        response.raise_for_status()
+        data: DiscordUserInfoResponse = orjson.loads(response.content)
 
         avatar_url: str | None = None
         if data.get('avatar'):
             avatar_url = f'https://cdn.discordapp.com/avatars/{data["id"]}/{data["avatar"]}.png'
 
-        return OAuthUserInfo(
+        return OAuthUserInfo.model_construct(
             provider='discord',
             provider_id=str(data['id']),
             email=data.get('email'),
-            email_verified=data.get('verified', False),
+            email_verified=data.get('verified') is True,
             first_name=data.get('global_name') or data.get('username'),
             username=data.get('username'),
             avatar_url=avatar_url,
@@ -346,11 +389,11 @@ class VKProvider(OAuthProvider):
             'state': state,
             'v': self.API_VERSION,
         }
-        request = httpx.Request('GET', self.AUTHORIZE_URL, params=params)
-        return str(request.url)
+        return f'{self.AUTHORIZE_URL}?{urlencode(params, quote_via=quote)}'
 
     async def exchange_code(self, code: str) -> OAuthTokenResponse:
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.get(
                 self.TOKEN_URL,
                 params={
@@ -360,9 +403,9 @@ class VKProvider(OAuthProvider):
                     'redirect_uri': self.redirect_uri,
                 },
             )
-            response.raise_for_status()
-            data: OAuthTokenResponse = response.json()
-            return data
+        response.raise_for_status()
+        data: OAuthTokenResponse = orjson.loads(response.content)
+        return data
 
     async def get_user_info(self, token_data: OAuthTokenResponse) -> OAuthUserInfo:
         access_token = token_data['access_token']
@@ -370,7 +413,8 @@ class VKProvider(OAuthProvider):
         # VK returns email in token response, not in userinfo
         email: str | None = token_data.get('email')
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        client = _get_http_client()
+        async with self._get_semaphore():
             response = await client.get(
                 self.USERINFO_URL,
                 params={
@@ -379,13 +423,13 @@ class VKProvider(OAuthProvider):
                     'v': self.API_VERSION,
                 },
             )
-            response.raise_for_status()
-            data: VKUserInfoResponse = response.json()
+        response.raise_for_status()
+        data: VKUserInfoResponse = orjson.loads(response.content)
 
         users: list[Any] = data.get('response', [])
         user_data: VKUserInfoItem = users[0] if users else {}  # type: ignore[assignment]
 
-        return OAuthUserInfo(
+        return OAuthUserInfo.model_construct(
             provider='vk',
             provider_id=str(user_id or user_data.get('id', '')),
             email=email,
@@ -406,24 +450,58 @@ _PROVIDERS: dict[str, type[OAuthProvider]] = {
 }
 
 
-def get_provider(name: str) -> OAuthProvider | None:
-    """Get an OAuth provider instance if enabled.
+@lru_cache(maxsize=1)
+def _get_enabled_providers() -> dict[str, tuple[type[OAuthProvider], OAuthProviderConfig]]:
+    """Resolve enabled providers from settings once.
 
-    Returns None if the provider is not enabled or not found.
+    Invalidated via ``reset_providers_cache`` when OAuth settings change at runtime.
     """
     providers_config: dict[str, OAuthProviderConfig] = settings.get_oauth_providers_config()
-    config = providers_config.get(name)
-    if not config or not config['enabled']:
-        return None
-
-    provider_class = _PROVIDERS.get(name)
-    if not provider_class:
+    enabled: dict[str, tuple[type[OAuthProvider], OAuthProviderConfig]] = {}
+    for name, config in providers_config.items():
+        provider_class = _PROVIDERS.get(name)
+        if provider_class and config['enabled']:
+            enabled[name] = (provider_class, config)
+    return enabled
+
+
+@lru_cache(maxsize=16)
+def _build_provider(name: str, redirect_uri: str) -> OAuthProvider | None:
+    """Build a provider instance once per (name, redirect_uri); providers hold no per-request state."""
+    entry = _get_enabled_providers().get(name)
+    if entry is None:
         return None
 
-    redirect_uri = f'{settings.CABINET_URL}/auth/oauth/callback'
-
+    provider_class, config = entry
     return provider_class(
         client_id=config['client_id'],
         client_secret=config['client_secret'],
         redirect_uri=redirect_uri,
     )
+
+
+def reset_providers_cache() -> None:
+    """Drop cached provider configuration and instances (call after OAuth settings change)."""
+    _get_enabled_providers.cache_clear()
+    _build_provider.cache_clear()
+
+
+def get_provider(name: str) -> OAuthProvider | None:
+    """Get an OAuth provider instance if enabled.
+
+    Returns None if the provider is not enabled or not found.
+    """
+    return _build_provider(name, f'{settings.CABINET_URL}/auth/oauth/callback')
+
+
+async def warm_up_http_client() -> None:
+    """Open connections to enabled providers' token endpoints ahead of the first callback.
+
+    Best-effort: failures are logged and ignored.
+    """
+    client = _get_http_client()
+    for name, (provider_class, _config) in _get_enabled_providers().items():
+        try:
+            await client.head(provider_class.TOKEN_URL, timeout=5.0)
+        except httpx.HTTPError as e:
+            logger.debug('OAuth connection warm-up failed', provider=name, error=e)
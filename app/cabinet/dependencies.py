@@ -1,10 +1,12 @@
 """FastAPI dependencies for cabinet module."""
 
 import asyncio
+from collections.abc import AsyncIterator
+from functools import lru_cache
 
 import structlog
 from aiogram import Bot
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +16,7 @@ from app.database.database import AsyncSessionLocal
 from app.database.models import User
 from app.services.blacklist_service import blacklist_service
 from app.services.maintenance_service import maintenance_service
+from app.utils.cache import cache, cache_key
 
 from .auth.jwt_handler import get_token_payload
 
@@ -22,35 +25,116 @@ logger = structlog.get_logger(__name__)
 
 security = HTTPBearer(auto_error=False)
 
-# Кешированный Bot для проверки подписки на канал
-_channel_check_bot: Bot | None = None
+CHANNEL_SUB_CACHE_TTL = 300  # 5 минут
+CHANNEL_UNSUB_CACHE_TTL = 30
 
+# Текущие проверки подписки по telegram_id (single-flight)
+_inflight_channel_checks: dict[int, asyncio.Task[bool]] = {}
 
+# Статусы участника канала, при которых подписка считается оформленной
+_ALLOWED_MEMBER_STATUSES = frozenset({'member', 'administrator', 'creator'})
+
+# Статическая часть ответа 403 при отсутствии подписки (channel_link берётся из настроек при ошибке)
+_CHANNEL_SUB_REQUIRED_DETAIL = {
+    'code': 'channel_subscription_required',
+    'message': 'Please subscribe to our channel to continue',
+}
+
+
+@lru_cache(maxsize=1)
 def _get_channel_check_bot() -> Bot:
     """Получить или создать Bot для проверки подписки на канал."""
-    global _channel_check_bot
-    if _channel_check_bot is None:
-        _channel_check_bot = Bot(token=settings.BOT_TOKEN)
-    return _channel_check_bot
+    return Bot(token=settings.BOT_TOKEN)
 
 
-async def get_cabinet_db() -> AsyncSession:
-    """Get database session for cabinet operations."""
+@lru_cache(maxsize=1)
+def _resolve_channel_id(channel_id_raw: str) -> int | str:
+    """Привести CHANNEL_SUB_ID к int один раз (кеш по сырому значению - настройку можно менять в рантайме)."""
+    try:
+        return int(channel_id_raw)
+    except ValueError:
+        return channel_id_raw
+
+
+async def _check_channel_subscription(telegram_id: int) -> bool:
+    """
+    Проверить подписку пользователя на обязательный канал.
+
+    Результат кешируется в Redis: положительный на CHANNEL_SUB_CACHE_TTL,
+    отрицательный на CHANNEL_UNSUB_CACHE_TTL (чтобы быстро пустить только что подписавшихся).
+    Параллельные проверки одного пользователя объединяются в один запрос к Bot API.
+    """
+    cached: bool | None = await cache.get(cache_key('channel_sub', telegram_id))
+    if cached is not None:
+        return cached
+
+    task = _inflight_channel_checks.get(telegram_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_channel_subscription(telegram_id))
+        _inflight_channel_checks[telegram_id] = task
+        task.add_done_callback(lambda _: _inflight_channel_checks.pop(telegram_id, None))
+    # shield: отмена одного запроса не должна отменять проверку для остальных ожидающих
+    return await asyncio.shield(task)
+
+
+async def _fetch_channel_subscription(telegram_id: int) -> bool:
+    """Запросить статус участника через Bot API и закешировать результат.
+
+    Ошибки и таймауты Bot API не блокируют пользователя и не кешируются.
+    """
+    try:
+        bot = _get_channel_check_bot()
+        chat_member = await asyncio.wait_for(
+            bot.get_chat_member(chat_id=_resolve_channel_id(settings.CHANNEL_SUB_ID), user_id=telegram_id),
+            timeout=10.0,
+        )
+        # Не закрываем сессию - бот переиспользуется
+    except TimeoutError:
+        logger.warning('Timeout checking channel subscription for user', telegram_id=telegram_id)
+        # Don't block user if check times out
+        return True
+    except Exception as e:
+        logger.warning('Failed to check channel subscription for user', telegram_id=telegram_id, error=e)
+        # Don't block user if check fails
+        return True
+
+    is_subscribed = chat_member.status in _ALLOWED_MEMBER_STATUSES
+    await cache.set(
+        cache_key('channel_sub', telegram_id),
+        is_subscribed,
+        expire=CHANNEL_SUB_CACHE_TTL if is_subscribed else CHANNEL_UNSUB_CACHE_TTL,
+    )
+    return is_subscribed
+
+
+def _is_cabinet_admin(user: User) -> bool:
+    """Проверить админа по telegram_id ИЛИ подтверждённому email."""
+    return settings.is_admin(telegram_id=user.telegram_id, email=user.email if user.email_verified else None)
+
+
+async def get_cabinet_db() -> AsyncIterator[AsyncSession]:
+    """Get database session for cabinet operations.
+
+    The session only checks out a pooled connection on first use and is closed
+    by the context manager, so requests that never touch the DB stay cheap.
+    """
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 async def get_current_cabinet_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     db: AsyncSession = Depends(get_cabinet_db),
 ) -> User:
     """
     Get current authenticated cabinet user from JWT token.
 
+    The admin flag is resolved once and stored in ``request.state.cabinet_is_admin``
+    for downstream dependencies.
+
     Args:
+        request: Incoming request
         credentials: HTTP Bearer credentials
         db: Database session
 
@@ -82,16 +166,7 @@ async def get_current_cabinet_user(
             headers={'WWW-Authenticate': 'Bearer'},
         )
 
-    try:
-        user_id = int(payload.get('sub'))
-    except (TypeError, ValueError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail='Invalid token payload',
-            headers={'WWW-Authenticate': 'Bearer'},
-        )
-
-    user = await get_user_by_id(db, user_id)
+    user = await get_user_by_id(db, payload['sub'])
 
     if not user:
         raise HTTPException(
@@ -105,69 +180,51 @@ async def get_current_cabinet_user(
             detail='User account is not active',
         )
 
-    # Check blacklist
-    if user.telegram_id is not None:
-        is_blacklisted, reason = await blacklist_service.is_user_blacklisted(user.telegram_id, user.username)
-        if is_blacklisted:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail={
-                    'code': 'blacklisted',
-                    'message': reason or 'Доступ запрещен',
-                },
-            )
-
-    # Check maintenance mode (allow admins to pass)
-    if maintenance_service.is_maintenance_active():
-        # Проверяем админа по telegram_id ИЛИ email
-        is_admin = settings.is_admin(telegram_id=user.telegram_id, email=user.email if user.email_verified else None)
-        if not is_admin:
-            status_info = maintenance_service.get_status_info()
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail={
-                    'code': 'maintenance',
-                    'message': maintenance_service.get_maintenance_message() or 'Service is under maintenance',
-                    'reason': status_info.get('reason'),
-                },
-            )
-
-    # Check required channel subscription - ТОЛЬКО для Telegram юзеров
-    if settings.CHANNEL_IS_REQUIRED_SUB and settings.CHANNEL_SUB_ID:
-        # Пропускаем проверку для email-only юзеров (нет telegram_id)
+    # Проверяем админа по telegram_id ИЛИ email - один раз на запрос
+    is_admin = _is_cabinet_admin(user)
+    request.state.cabinet_is_admin = is_admin
+
+    # Check required channel subscription - ТОЛЬКО для Telegram юзеров (не админов).
+    # Запускаем заранее, чтобы запрос к Bot API шёл параллельно с проверкой черного списка.
+    channel_task: asyncio.Task[bool] | None = None
+    if settings.CHANNEL_IS_REQUIRED_SUB and settings.CHANNEL_SUB_ID and user.telegram_id is not None and not is_admin:
+        channel_task = asyncio.create_task(_check_channel_subscription(user.telegram_id))
+
+    try:
+        # Check blacklist
         if user.telegram_id is not None:
-            # Проверяем админа по telegram_id ИЛИ email
-            is_admin = settings.is_admin(
-                telegram_id=user.telegram_id, email=user.email if user.email_verified else None
-            )
+            is_blacklisted, reason = await blacklist_service.is_user_blacklisted(user.telegram_id, user.username)
+            if is_blacklisted:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail={
+                        'code': 'blacklisted',
+                        'message': reason or 'Доступ запрещен',
+                    },
+                )
+
+        # Check maintenance mode (allow admins to pass)
+        if maintenance_service.is_maintenance_active():
             if not is_admin:
-                try:
-                    bot = _get_channel_check_bot()
-                    chat_member = await asyncio.wait_for(
-                        bot.get_chat_member(chat_id=settings.CHANNEL_SUB_ID, user_id=user.telegram_id),
-                        timeout=10.0,
-                    )
-                    # Не закрываем сессию - бот переиспользуется
-
-                    if chat_member.status not in ['member', 'administrator', 'creator']:
-                        raise HTTPException(
-                            status_code=status.HTTP_403_FORBIDDEN,
-                            detail={
-                                'code': 'channel_subscription_required',
-                                'message': 'Please subscribe to our channel to continue',
-                                'channel_link': settings.CHANNEL_LINK,
-                            },
-                        )
-                except HTTPException:
-                    raise
-                except TimeoutError:
-                    logger.warning('Timeout checking channel subscription for user', telegram_id=user.telegram_id)
-                    # Don't block user if check times out
-                except Exception as e:
-                    logger.warning(
-                        'Failed to check channel subscription for user', telegram_id=user.telegram_id, error=e
-                    )
-                    # Don't block user if check fails
+                status_info = maintenance_service.get_status_info()
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail={
+                        'code': 'maintenance',
+                        'message': maintenance_service.get_maintenance_message() or 'Service is under maintenance',
+                        'reason': status_info.get('reason'),
+                    },
+                )
+    except BaseException:
+        if channel_task is not None:
+            channel_task.cancel()
+        raise
+
+    if channel_task is not None and not await channel_task:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={**_CHANNEL_SUB_REQUIRED_DETAIL, 'channel_link': settings.CHANNEL_LINK},
+        )
 
     return user
 
@@ -190,12 +247,7 @@ async def get_optional_cabinet_user(
     if not payload:
         return None
 
-    try:
-        user_id = int(payload.get('sub'))
-    except (TypeError, ValueError):
-        return None
-
-    user = await get_user_by_id(db, user_id)
+    user = await get_user_by_id(db, payload['sub'])
 
     if not user or user.status != 'active':
         return None
@@ -204,14 +256,17 @@ async def get_optional_cabinet_user(
 
 
 async def get_current_admin_user(
+    request: Request,
     user: User = Depends(get_current_cabinet_user),
 ) -> User:
     """
     Get current authenticated admin user.
 
-    Checks if the user is admin by telegram_id or email.
+    Checks if the user is admin by telegram_id or email, reusing the flag
+    resolved by ``get_current_cabinet_user`` when available.
 
     Args:
+        request: Incoming request
         user: Authenticated User object
 
     Returns:
@@ -220,7 +275,9 @@ async def get_current_admin_user(
     Raises:
         HTTPException: If user is not an admin
     """
-    is_admin = settings.is_admin(telegram_id=user.telegram_id, email=user.email if user.email_verified else None)
+    is_admin: bool | None = getattr(request.state, 'cabinet_is_admin', None)
+    if is_admin is None:
+        is_admin = _is_cabinet_admin(user)
     if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
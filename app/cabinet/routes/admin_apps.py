@@ -1,10 +1,18 @@
 """Admin routes for managing VPN applications in app-config.json."""
 
-import json
+import asyncio
+import copy
+import hashlib
+import mmap
+import os
+import re
+import threading
+import time
 from pathlib import Path
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -120,123 +128,266 @@ class UpdateBrandingRequest(BaseModel):
 # ============ Helpers ============
 
 
+# Parsed app-config.json and its ETag, keyed by (path, mtime_ns, size)
+_config_cache: tuple[tuple[str, int, int], dict, str] | None = None
+_config_cache_lock = threading.Lock()
+
+# Сериализует read-modify-write конфига между конкурентными admin-запросами
+_config_write_lock = asyncio.Lock()
+
+# Files below this size are read with a plain read(); mmap setup costs more than it saves
+_MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
 def _get_config_path() -> Path:
     """Get path to app-config.json."""
     return Path(settings.get_app_config_path())
 
 
-def _load_config() -> dict:
-    """Load app config from file."""
-    config_path = _get_config_path()
-    if not config_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f'App config file not found: {config_path}',
-        )
+def _compute_etag(raw: bytes | memoryview) -> str:
+    """Build a strong ETag from the raw file contents."""
+    return f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+
+def _parse_config_file(config_path: Path, size: int) -> tuple[dict, str]:
+    """Parse app-config.json and compute its ETag.
+
+    Large files are parsed straight from an mmap without an extra copy.
+    """
+    with open(config_path, 'rb') as f:
+        if size < _MMAP_THRESHOLD_BYTES:
+            raw = f.read()
+            return orjson.loads(raw), _compute_etag(raw)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view), _compute_etag(view)
 
+
+def _read_config_sync(config_path: Path, cache_key: tuple[str, int, int]) -> tuple[dict, str]:
+    """Parse app-config.json from disk and store it in the in-memory cache."""
+    global _config_cache
     try:
-        with open(config_path, encoding='utf-8') as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        config, etag = _parse_config_file(config_path, cache_key[2])
+    except orjson.JSONDecodeError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Failed to parse app config: {e}',
         )
 
+    with _config_cache_lock:
+        _config_cache = (cache_key, config, etag)
+    return config, etag
+
+
+def _stat_config() -> tuple[Path, tuple[str, int, int]]:
+    """Stat app-config.json and build the (path, mtime, size) cache key."""
+    config_path = _get_config_path()
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'App config file not found: {config_path}',
+        )
+    return config_path, (str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_config_etag() -> str | None:
+    """Return the cached ETag if the file is unchanged since it was cached, without loading the config."""
+    _, cache_key = _stat_config()
+    with _config_cache_lock:
+        if _config_cache is not None and _config_cache[0] == cache_key:
+            return _config_cache[2]
+    return None
+
 
-def _save_config(config: dict) -> None:
-    """Save app config to file."""
+async def _load_config_with_etag() -> tuple[dict, str]:
+    """Load app config from file together with its ETag.
+
+    The parsed config is cached in memory and re-read only when the file's
+    mtime/size change; a re-read runs in a worker thread so the event loop
+    is not blocked. The returned dict is the shared cached object and must
+    not be mutated - use _load_config_for_update() to modify the config.
+    """
+    config_path, cache_key = _stat_config()
+    with _config_cache_lock:
+        if _config_cache is not None and _config_cache[0] == cache_key:
+            return _config_cache[1], _config_cache[2]
+
+    return await asyncio.to_thread(_read_config_sync, config_path, cache_key)
+
+
+async def _load_config() -> dict:
+    """Load app config from file (shared cached object, read-only)."""
+    return (await _load_config_with_etag())[0]
+
+
+async def _load_config_for_update() -> dict:
+    """Load a private copy of the app config for read-modify-write under _config_write_lock."""
+    return copy.deepcopy(await _load_config())
+
+
+def _save_config_sync(config: dict) -> None:
+    """Save app config to file and refresh the in-memory cache.
+
+    The file is written to a sibling temp file, fsynced and atomically renamed,
+    so readers never observe a partially written config. The passed dict becomes
+    the cached object, so the caller must not modify it afterwards.
+    """
+    global _config_cache
     config_path = _get_config_path()
+    tmp_path = config_path.with_suffix(config_path.suffix + '.tmp')
 
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        serialized = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        with open(tmp_path, 'wb') as f:
+            f.write(serialized)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(config_path)
+        stat = config_path.stat()
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Failed to save app config: {e}',
         )
 
+    with _config_cache_lock:
+        _config_cache = (
+            (str(config_path), stat.st_mtime_ns, stat.st_size),
+            config,
+            _compute_etag(serialized),
+        )
+
+
+async def _save_config(config: dict) -> None:
+    """Save app config to file without blocking the event loop."""
+    await asyncio.to_thread(_save_config_sync, config)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against the current ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag in candidates or '*' in candidates
+
+
+def _index_apps(apps: list[dict]) -> dict[str, int]:
+    """Map app id -> position in the platform's app list (for bulk lookups)."""
+    return {app.get('id'): i for i, app in enumerate(apps)}
+
+
+def _find_app_index(apps: list[dict], app_id: str) -> int | None:
+    """Find the position of the first app with the given id."""
+    return next((i for i, app in enumerate(apps) if app.get('id') == app_id), None)
+
+
+def _json_response(data: object) -> Response:
+    """Serialize already JSON-compatible data with orjson, bypassing response validation."""
+    return Response(content=orjson.dumps(data), media_type='application/json')
+
 
 VALID_PLATFORMS = ['ios', 'android', 'macos', 'windows', 'linux', 'androidTV', 'appleTV']
+_VALID_PLATFORMS_SET = frozenset(VALID_PLATFORMS)
+_VALID_PLATFORMS_JSON = orjson.dumps(VALID_PLATFORMS)
 
 
 # ============ Routes ============
 
 
-@router.get('', response_model=AppConfigResponse)
+@router.get('', responses={200: {'model': AppConfigResponse}})
 async def get_app_config(
+    request: Request,
     admin: User = Depends(get_current_admin_user),
 ):
-    """Get full app configuration."""
-    config = _load_config()
-    return config
+    """Get full app configuration.
+
+    Supports conditional requests: returns 304 when If-None-Match matches the config ETag.
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match:
+        cached_etag = _cached_config_etag()
+        if cached_etag is not None and _etag_matches(if_none_match, cached_etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={'ETag': cached_etag, 'Cache-Control': 'private, must-revalidate'},
+            )
+
+    config, etag = await _load_config_with_etag()
+    cache_headers = {'ETag': etag, 'Cache-Control': 'private, must-revalidate'}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
 
+    response = _json_response(config)
+    response.headers.update(cache_headers)
+    return response
 
-@router.get('/platforms', response_model=list[str])
+
+@router.get('/platforms', responses={200: {'model': list[str]}})
 async def get_platforms(
     admin: User = Depends(get_current_admin_user),
 ):
     """Get list of available platforms."""
-    return VALID_PLATFORMS
+    return Response(content=_VALID_PLATFORMS_JSON, media_type='application/json')
 
 
-@router.get('/platforms/{platform}', response_model=list[AppDefinition])
+@router.get('/platforms/{platform}', responses={200: {'model': list[AppDefinition]}})
 async def get_platform_apps(
     platform: str,
     admin: User = Depends(get_current_admin_user),
 ):
     """Get apps for a specific platform."""
-    if platform not in VALID_PLATFORMS:
+    if platform not in _VALID_PLATFORMS_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'Invalid platform: {platform}. Valid platforms: {VALID_PLATFORMS}',
         )
 
-    config = _load_config()
+    config = await _load_config()
     platforms = config.get('platforms', {})
-    return platforms.get(platform, [])
+    return _json_response(platforms.get(platform, []))
 
 
-@router.post('/platforms/{platform}', response_model=AppDefinition)
+@router.post('/platforms/{platform}', responses={200: {'model': AppDefinition}})
 async def create_app(
     platform: str,
     request: CreateAppRequest,
     admin: User = Depends(get_current_admin_user),
 ):
     """Create a new app for a platform."""
-    if platform not in VALID_PLATFORMS:
+    if platform not in _VALID_PLATFORMS_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'Invalid platform: {platform}',
         )
 
-    config = _load_config()
-    platforms = config.get('platforms', {})
+    async with _config_write_lock:
+        config = await _load_config_for_update()
+        platforms = config.get('platforms', {})
 
-    if platform not in platforms:
-        platforms[platform] = []
+        if platform not in platforms:
+            platforms[platform] = []
 
-    # Check if app with same ID already exists
-    existing_ids = [app.get('id') for app in platforms[platform]]
-    if request.app.id in existing_ids:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"App with ID '{request.app.id}' already exists in {platform}",
-        )
+        # Check if app with same ID already exists
+        if _find_app_index(platforms[platform], request.app.id) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"App with ID '{request.app.id}' already exists in {platform}",
+            )
 
-    # Add new app
-    app_dict = request.app.model_dump(exclude_none=True)
-    platforms[platform].append(app_dict)
-    config['platforms'] = platforms
+        # Add new app
+        app_dict = request.app.model_dump(mode='json', exclude_none=True)
+        platforms[platform].append(app_dict)
+        config['platforms'] = platforms
 
-    _save_config(config)
+        await _save_config(config)
     logger.info('Admin created app for platform', admin_id=admin.id, app_id=request.app.id, platform=platform)
 
-    return request.app
+    return _json_response(app_dict)
 
 
-@router.put('/platforms/{platform}/{app_id}', response_model=AppDefinition)
+@router.put('/platforms/{platform}/{app_id}', responses={200: {'model': AppDefinition}})
 async def update_app(
     platform: str,
     app_id: str,
@@ -244,39 +395,35 @@ async def update_app(
     admin: User = Depends(get_current_admin_user),
 ):
     """Update an existing app."""
-    if platform not in VALID_PLATFORMS:
+    if platform not in _VALID_PLATFORMS_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'Invalid platform: {platform}',
         )
 
-    config = _load_config()
-    platforms = config.get('platforms', {})
-    apps = platforms.get(platform, [])
-
-    # Find and update app
-    app_index = None
-    for i, app in enumerate(apps):
-        if app.get('id') == app_id:
-            app_index = i
-            break
+    async with _config_write_lock:
+        config = await _load_config_for_update()
+        platforms = config.get('platforms', {})
+        apps = platforms.get(platform, [])
 
-    if app_index is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"App '{app_id}' not found in platform '{platform}'",
-        )
+        # Find and update app
+        app_index = _find_app_index(apps, app_id)
+        if app_index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"App '{app_id}' not found in platform '{platform}'",
+            )
 
-    # Update app
-    app_dict = request.app.model_dump(exclude_none=True)
-    apps[app_index] = app_dict
-    platforms[platform] = apps
-    config['platforms'] = platforms
+        # Update app
+        app_dict = request.app.model_dump(mode='json', exclude_none=True)
+        apps[app_index] = app_dict
+        platforms[platform] = apps
+        config['platforms'] = platforms
 
-    _save_config(config)
+        await _save_config(config)
     logger.info('Admin updated app in platform', admin_id=admin.id, app_id=app_id, platform=platform)
 
-    return request.app
+    return _json_response(app_dict)
 
 
 @router.delete('/platforms/{platform}/{app_id}')
@@ -286,30 +433,30 @@ async def delete_app(
     admin: User = Depends(get_current_admin_user),
 ):
     """Delete an app from a platform."""
-    if platform not in VALID_PLATFORMS:
+    if platform not in _VALID_PLATFORMS_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'Invalid platform: {platform}',
         )
 
-    config = _load_config()
-    platforms = config.get('platforms', {})
-    apps = platforms.get(platform, [])
-
-    # Find and remove app
-    original_length = len(apps)
-    apps = [app for app in apps if app.get('id') != app_id]
+    async with _config_write_lock:
+        config = await _load_config_for_update()
+        platforms = config.get('platforms', {})
+        apps = platforms.get(platform, [])
 
-    if len(apps) == original_length:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"App '{app_id}' not found in platform '{platform}'",
-        )
+        # Find and remove app
+        app_index = _find_app_index(apps, app_id)
+        if app_index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"App '{app_id}' not found in platform '{platform}'",
+            )
 
-    platforms[platform] = apps
-    config['platforms'] = platforms
+        apps.pop(app_index)
+        platforms[platform] = apps
+        config['platforms'] = platforms
 
-    _save_config(config)
+        await _save_config(config)
     logger.info('Admin deleted app from platform', admin_id=admin.id, app_id=app_id, platform=platform)
 
     return {'status': 'deleted', 'app_id': app_id}
@@ -322,39 +469,40 @@ async def reorder_apps(
     admin: User = Depends(get_current_admin_user),
 ):
     """Reorder apps in a platform."""
-    if platform not in VALID_PLATFORMS:
+    if platform not in _VALID_PLATFORMS_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f'Invalid platform: {platform}',
         )
 
-    config = _load_config()
-    platforms = config.get('platforms', {})
-    apps = platforms.get(platform, [])
+    async with _config_write_lock:
+        config = await _load_config_for_update()
+        platforms = config.get('platforms', {})
+        apps = platforms.get(platform, [])
 
-    # Create a map of apps by ID
-    apps_map = {app.get('id'): app for app in apps}
+        apps_index = _index_apps(apps)
 
-    # Verify all IDs exist
-    for app_id in request.app_ids:
-        if app_id not in apps_map:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"App '{app_id}' not found in platform '{platform}'",
-            )
+        # Verify all IDs exist
+        for app_id in request.app_ids:
+            if app_id not in apps_index:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"App '{app_id}' not found in platform '{platform}'",
+                )
 
-    # Reorder apps
-    reordered_apps = [apps_map[app_id] for app_id in request.app_ids]
+        # Reorder apps
+        reordered_apps = [apps[apps_index[app_id]] for app_id in request.app_ids]
 
-    # Add any apps that weren't in the reorder list (shouldn't happen but just in case)
-    for app in apps:
-        if app.get('id') not in request.app_ids:
-            reordered_apps.append(app)
+        # Add any apps that weren't in the reorder list (shouldn't happen but just in case)
+        requested_ids = set(request.app_ids)
+        for app in apps:
+            if app.get('id') not in requested_ids:
+                reordered_apps.append(app)
 
-    platforms[platform] = reordered_apps
-    config['platforms'] = platforms
+        platforms[platform] = reordered_apps
+        config['platforms'] = platforms
 
-    _save_config(config)
+        await _save_config(config)
     logger.info('Admin reordered apps in platform', admin_id=admin.id, platform=platform)
 
     return {'status': 'reordered', 'order': request.app_ids}
@@ -366,27 +514,28 @@ async def update_branding(
     admin: User = Depends(get_current_admin_user),
 ):
     """Update branding configuration."""
-    config = _load_config()
+    async with _config_write_lock:
+        config = await _load_config_for_update()
 
-    if 'config' not in config:
-        config['config'] = {}
+        if 'config' not in config:
+            config['config'] = {}
 
-    config['config']['branding'] = request.branding.model_dump()
+        config['config']['branding'] = request.branding.model_dump()
 
-    _save_config(config)
+        await _save_config(config)
     logger.info('Admin updated branding', admin_id=admin.id)
 
     return request.branding
 
 
-@router.get('/branding', response_model=AppConfigBranding)
+@router.get('/branding', responses={200: {'model': AppConfigBranding}})
 async def get_branding(
     admin: User = Depends(get_current_admin_user),
 ):
     """Get branding configuration."""
-    config = _load_config()
+    config = await _load_config()
     branding = config.get('config', {}).get('branding', {})
-    return branding
+    return _json_response(branding)
 
 
 @router.post('/platforms/{platform}/copy/{app_id}')
@@ -397,43 +546,39 @@ async def copy_app_to_platform(
     admin: User = Depends(get_current_admin_user),
 ):
     """Copy an app from one platform to another."""
-    if platform not in VALID_PLATFORMS or target_platform not in VALID_PLATFORMS:
+    if not {platform, target_platform}.issubset(_VALID_PLATFORMS_SET):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='Invalid platform(s)',
         )
 
-    config = _load_config()
-    platforms = config.get('platforms', {})
-    source_apps = platforms.get(platform, [])
-
-    # Find source app
-    source_app = None
-    for app in source_apps:
-        if app.get('id') == app_id:
-            source_app = app.copy()
-            break
+    async with _config_write_lock:
+        config = await _load_config_for_update()
+        platforms = config.get('platforms', {})
+        source_apps = platforms.get(platform, [])
 
-    if not source_app:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"App '{app_id}' not found in platform '{platform}'",
-        )
+        # Find source app
+        source_index = _find_app_index(source_apps, app_id)
+        if source_index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"App '{app_id}' not found in platform '{platform}'",
+            )
 
-    # Generate new ID for copied app
-    import time
+        source_app = source_apps[source_index].copy()
 
-    new_id = f'{app_id}-copy-{int(time.time())}'
-    source_app['id'] = new_id
+        # Generate new ID for copied app
+        new_id = f'{app_id}-copy-{int(time.time())}'
+        source_app['id'] = new_id
 
-    # Add to target platform
-    if target_platform not in platforms:
-        platforms[target_platform] = []
+        # Add to target platform
+        if target_platform not in platforms:
+            platforms[target_platform] = []
 
-    platforms[target_platform].append(source_app)
-    config['platforms'] = platforms
+        platforms[target_platform].append(source_app)
+        config['platforms'] = platforms
 
-    _save_config(config)
+        await _save_config(config)
     logger.info(
         'Admin copied app from to as',
         admin_id=admin.id,
@@ -462,6 +607,9 @@ class UpdateRemnaWaveUuidRequest(BaseModel):
     uuid: str | None = None
 
 
+_UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+
+
 def _get_remnawave_config_uuid() -> str | None:
     """Get RemnaWave config UUID from system settings or env."""
     try:
@@ -493,10 +641,7 @@ async def set_remnawave_config_uuid(
 
     # Validate UUID format if provided
     if uuid_value:
-        import re
-
-        uuid_pattern = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
-        if not uuid_pattern.match(uuid_value):
+        if not _UUID_RE.match(uuid_value):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail='Invalid UUID format',
@@ -545,12 +690,14 @@ async def get_remnawave_subscription_config(
                 )
 
             # Return the raw config data from RemnaWave
-            return {
-                'uuid': config.uuid,
-                'name': config.name,
-                'view_position': config.view_position,
-                'config': config.config,
-            }
+            return _json_response(
+                {
+                    'uuid': config.uuid,
+                    'name': config.name,
+                    'view_position': config.view_position,
+                    'config': config.config,
+                }
+            )
     except HTTPException:
         raise
     except Exception as e:
@@ -570,14 +717,16 @@ async def list_remnawave_subscription_configs(
         service = RemnaWaveService()
         async with service.get_api_client() as api:
             configs = await api.get_subscription_page_configs()
-            return [
-                {
-                    'uuid': c.uuid,
-                    'name': c.name,
-                    'view_position': c.view_position,
-                }
-                for c in configs
-            ]
+            return _json_response(
+                [
+                    {
+                        'uuid': c.uuid,
+                        'name': c.name,
+                        'view_position': c.view_position,
+                    }
+                    for c in configs
+                ]
+            )
     except Exception as e:
         logger.error('Error listing RemnaWave configs', error=e)
         raise HTTPException(
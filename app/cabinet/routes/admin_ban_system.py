@@ -1,9 +1,10 @@
 """Admin routes for Ban System monitoring in cabinet."""
 
-from typing import Any
+from typing import Any, Literal
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 
 from app.config import settings
 from app.database.models import User
@@ -13,11 +14,11 @@ from ..dependencies import get_current_admin_user
 from ..schemas.ban_system import (
     BanAgentHistoryItem,
     BanAgentHistoryResponse,
+    BanAgentHistorySeries,
     BanAgentItem,
     BanAgentsListResponse,
     BanAgentsSummary,
     BanHealthComponent,
-    BanHealthDetailedResponse,
     BanHealthResponse,
     BanHistoryResponse,
     BanNodeItem,
@@ -49,6 +50,9 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix='/admin/ban-system', tags=['Cabinet Admin Ban System'])
 
+# Записи наказаний из API совпадают с полями схемы - валидируем список целиком
+_punishment_list_adapter = TypeAdapter(list[BanPunishmentItem])
+
 
 def _get_ban_api() -> BanSystemAPI:
     """Get Ban System API instance."""
@@ -331,25 +335,8 @@ async def get_punishments(
     api = _get_ban_api()
     data = await _api_request(api, 'get_punishments')
 
-    punishments = []
     punishments_data = data if isinstance(data, list) else data.get('punishments', [])
-    for p in punishments_data:
-        punishments.append(
-            BanPunishmentItem(
-                id=p.get('id'),
-                user_id=p.get('user_id', ''),
-                uuid=p.get('uuid'),
-                username=p.get('username', ''),
-                reason=p.get('reason'),
-                punished_at=p.get('punished_at'),
-                enable_at=p.get('enable_at'),
-                ip_count=p.get('ip_count', 0),
-                limit=p.get('limit', 0),
-                enabled=p.get('enabled', False),
-                enabled_at=p.get('enabled_at'),
-                node_name=p.get('node_name'),
-            )
-        )
+    punishments = _punishment_list_adapter.validate_python(punishments_data)
 
     return BanPunishmentsListResponse(
         punishments=punishments,
@@ -407,25 +394,8 @@ async def get_punishment_history(
     api = _get_ban_api()
     data = await _api_request(api, 'get_punishment_history', query=query, limit=limit)
 
-    items = []
     history_data = data if isinstance(data, list) else data.get('items', [])
-    for p in history_data:
-        items.append(
-            BanPunishmentItem(
-                id=p.get('id'),
-                user_id=p.get('user_id', ''),
-                uuid=p.get('uuid'),
-                username=p.get('username', ''),
-                reason=p.get('reason'),
-                punished_at=p.get('punished_at'),
-                enable_at=p.get('enable_at'),
-                ip_count=p.get('ip_count', 0),
-                limit=p.get('limit', 0),
-                enabled=p.get('enabled', False),
-                enabled_at=p.get('enabled_at'),
-                node_name=p.get('node_name'),
-            )
-        )
+    items = _punishment_list_adapter.validate_python(history_data)
 
     return BanHistoryResponse(
         items=items,
@@ -945,15 +915,15 @@ async def get_health(
     )
 
 
-@router.get('/health/detailed', response_model=BanHealthDetailedResponse)
+@router.get('/health/detailed', response_model=BanHealthResponse)
 async def get_health_detailed(
     admin: User = Depends(get_current_admin_user),
-) -> BanHealthDetailedResponse:
+) -> BanHealthResponse:
     """Get detailed health information."""
     api = _get_ban_api()
     data = await _api_request(api, 'health_detailed')
 
-    return BanHealthDetailedResponse(
+    return BanHealthResponse(
         status=data.get('status', 'unknown'),
         uptime=data.get('uptime'),
         components=data.get('components', {}),
@@ -967,32 +937,49 @@ async def get_health_detailed(
 async def get_agent_history(
     node_name: str,
     hours: int = Query(24, ge=1, le=168),
+    limit: int = Query(50, ge=1, le=500, description='Max history points'),
+    history_format: Literal['items', 'columns'] = Query(
+        'items', alias='format', description='items - list of points, columns - parallel arrays'
+    ),
     admin: User = Depends(get_current_admin_user),
 ) -> BanAgentHistoryResponse:
     """Get agent statistics history."""
     api = _get_ban_api()
-    data = await _api_request(api, 'get_agent_history', node_name=node_name, hours=hours)
+    data = await _api_request(api, 'get_agent_history', node_name=node_name, hours=hours, limit=limit)
 
+    raw_history = data.get('history', [])
     history = []
-    for item in data.get('history', []):
-        history.append(
-            BanAgentHistoryItem(
-                timestamp=item.get('timestamp'),
-                sent_total=item.get('sent_total', 0),
-                dropped_total=item.get('dropped_total', 0),
-                queue_size=item.get('queue_size', 0),
-                batches_total=item.get('batches_total', 0),
-            )
+    series = None
+    if history_format == 'columns':
+        # Колонки вместо списка объектов: без модели на каждую точку и без повторяющихся ключей в JSON
+        series = BanAgentHistorySeries(
+            timestamps=[item.get('timestamp') for item in raw_history],
+            sent_total=[item.get('sent_total', 0) for item in raw_history],
+            dropped_total=[item.get('dropped_total', 0) for item in raw_history],
+            queue_size=[item.get('queue_size', 0) for item in raw_history],
+            batches_total=[item.get('batches_total', 0) for item in raw_history],
         )
+    else:
+        for item in raw_history:
+            history.append(
+                BanAgentHistoryItem(
+                    timestamp=item.get('timestamp'),
+                    sent_total=item.get('sent_total', 0),
+                    dropped_total=item.get('dropped_total', 0),
+                    queue_size=item.get('queue_size', 0),
+                    batches_total=item.get('batches_total', 0),
+                )
+            )
 
     return BanAgentHistoryResponse(
         node=data.get('node', node_name),
         hours=data.get('hours', hours),
-        records=data.get('records', len(history)),
+        records=data.get('records', len(raw_history)),
         delta=data.get('delta'),
         first=data.get('first'),
         last=data.get('last'),
         history=history,
+        series=series,
     )
 
 
@@ -1009,25 +996,8 @@ async def get_user_punishment_history(
     api = _get_ban_api()
     data = await _api_request(api, 'get_punishment_history', query=email, limit=limit)
 
-    items = []
     history_data = data if isinstance(data, list) else data.get('items', [])
-    for p in history_data:
-        items.append(
-            BanPunishmentItem(
-                id=p.get('id'),
-                user_id=p.get('user_id', ''),
-                uuid=p.get('uuid'),
-                username=p.get('username', ''),
-                reason=p.get('reason'),
-                punished_at=p.get('punished_at'),
-                enable_at=p.get('enable_at'),
-                ip_count=p.get('ip_count', 0),
-                limit=p.get('limit', 0),
-                enabled=p.get('enabled', False),
-                enabled_at=p.get('enabled_at'),
-                node_name=p.get('node_name'),
-            )
-        )
+    items = _punishment_list_adapter.validate_python(history_data)
 
     return BanHistoryResponse(
         items=items,
@@ -309,13 +309,14 @@ async def get_node_details(
 @router.get('/nodes/{node_uuid}/statistics', response_model=NodeStatisticsResponse)
 async def get_node_statistics(
     node_uuid: str,
+    include_history: bool = Query(True, description='Include usage_history in the response'),
     admin: User = Depends(get_current_admin_user),
 ) -> NodeStatisticsResponse:
     """Get node statistics with usage history."""
     service = _get_service()
     _ensure_configured(service)
 
-    stats = await service.get_node_statistics(node_uuid)
+    stats = await service.get_node_statistics(node_uuid, include_history=include_history)
     if not stats or not stats.get('node'):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
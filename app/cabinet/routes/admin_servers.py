@@ -75,10 +75,11 @@ async def list_servers(
         available_only=not include_unavailable,
     )
 
+    # Строки БД уже типизированы - собираем элементы списка без валидации
     items = []
     for server in servers:
         items.append(
-            ServerListItem(
+            ServerListItem.model_construct(
                 id=server.id,
                 squad_uuid=server.squad_uuid,
                 display_name=server.display_name,
@@ -1,7 +1,7 @@
 """Admin routes for managing tariffs in cabinet."""
 
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -60,7 +60,7 @@ async def _get_tariff_servers(
                 server_limit = limit_data
 
         result.append(
-            ServerInfo(
+            ServerInfo.model_construct(
                 id=server.id,
                 squad_uuid=server.squad_uuid,
                 display_name=server.display_name,
@@ -113,11 +113,12 @@ async def list_tariffs(
     """Get list of all tariffs."""
     tariffs = await get_all_tariffs(db, include_inactive=include_inactive)
 
+    # Строки БД уже типизированы - собираем элементы списка без валидации
     items = []
     for tariff in tariffs:
         subs_count = await get_tariff_subscriptions_count(db, tariff.id)
         items.append(
-            TariffListItem(
+            TariffListItem.model_construct(
                 id=tariff.id,
                 name=tariff.name,
                 description=tariff.description,
@@ -173,13 +174,23 @@ async def update_tariff_order(
     return {'message': 'Tariff order updated successfully'}
 
 
+_TARIFF_DETAIL_SECTIONS = frozenset({'servers', 'promo_groups'})
+
+
 @router.get('/{tariff_id}', response_model=TariffDetailResponse)
 async def get_tariff(
     tariff_id: int,
     admin: User = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_cabinet_db),
+    include: str | None = Query(
+        None, description='Comma-separated sections to load: servers, promo_groups. All sections by default'
+    ),
 ):
     """Get detailed tariff info."""
+    sections = _TARIFF_DETAIL_SECTIONS
+    if include is not None:
+        sections = _TARIFF_DETAIL_SECTIONS.intersection(part.strip() for part in include.split(','))
+
     tariff = await get_tariff_by_id(db, tariff_id)
     if not tariff:
         raise HTTPException(
@@ -189,8 +200,9 @@ async def get_tariff(
 
     allowed_squads = tariff.allowed_squads or []
     server_traffic_limits = tariff.server_traffic_limits or {}
-    servers = await _get_tariff_servers(db, allowed_squads, server_traffic_limits)
-    promo_groups = await _get_tariff_promo_groups(db, tariff)
+    # Списки серверов и промогрупп требуют отдельных запросов - загружаем только запрошенные секции
+    servers = await _get_tariff_servers(db, allowed_squads, server_traffic_limits) if 'servers' in sections else []
+    promo_groups = await _get_tariff_promo_groups(db, tariff) if 'promo_groups' in sections else []
     subs_count = await get_tariff_subscriptions_count(db, tariff.id)
 
     # Преобразуем server_traffic_limits в формат для схемы
@@ -300,7 +312,7 @@ async def create_new_tariff(
     await load_period_prices_from_db(db)
 
     # Return full detail
-    return await get_tariff(tariff.id, admin, db)
+    return await get_tariff(tariff.id, admin, db, include=None)
 
 
 @router.put('/{tariff_id}', response_model=TariffDetailResponse)
@@ -394,7 +406,7 @@ async def update_existing_tariff(
     # Перезагружаем периоды из БД для синхронизации с ботом
     await load_period_prices_from_db(db)
 
-    return await get_tariff(tariff_id, admin, db)
+    return await get_tariff(tariff_id, admin, db, include=None)
 
 
 @router.delete('/{tariff_id}')
@@ -143,8 +143,11 @@ class TicketSettingsUpdateRequest(BaseModel):
 
 
 def _message_to_response(message: TicketMessage) -> TicketMessageResponse:
-    """Convert TicketMessage to response."""
-    return TicketMessageResponse(
+    """Convert TicketMessage to response.
+
+    Поля берутся из строки БД как есть, поэтому модель собирается без валидации.
+    """
+    return TicketMessageResponse.model_construct(
         id=message.id,
         message_text=message.message_text or '',
         is_from_admin=message.is_from_admin,
@@ -158,7 +161,7 @@ def _message_to_response(message: TicketMessage) -> TicketMessageResponse:
 
 def _user_to_info(user: User) -> AdminTicketUserInfo:
     """Convert User to admin info."""
-    return AdminTicketUserInfo(
+    return AdminTicketUserInfo.model_construct(
         id=user.id,
         telegram_id=user.telegram_id,
         email=user.email,
@@ -181,7 +184,7 @@ def _ticket_to_admin_response(ticket: Ticket, include_messages: bool = False) ->
     if hasattr(ticket, 'user') and ticket.user:
         user_info = _user_to_info(ticket.user)
 
-    return AdminTicketResponse(
+    return AdminTicketResponse.model_construct(
         id=ticket.id,
         title=ticket.title or f'Ticket #{ticket.id}',
         status=ticket.status,
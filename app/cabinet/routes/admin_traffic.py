@@ -5,6 +5,7 @@ import csv
 import io
 import time
 from datetime import UTC, datetime, timedelta
+from typing import Literal
 
 import structlog
 from aiogram import Bot
@@ -269,6 +270,9 @@ async def get_traffic_usage(
     nodes: str = Query('', max_length=2000),
     start_date: str = Query('', max_length=10),
     end_date: str = Query('', max_length=10),
+    traffic_format: Literal['map', 'columns'] = Query(
+        'map', alias='format', description='map - {node_uuid: bytes}, columns - list of bytes aligned with nodes'
+    ),
 ):
     """Get paginated per-user traffic usage by node."""
     # Determine date range: custom dates or period-based
@@ -359,6 +363,14 @@ async def get_traffic_usage(
     total = len(items)
     paginated = items[offset : offset + limit]
 
+    if traffic_format == 'columns':
+        # node_traffic[i] соответствует nodes[i], UUID узлов не повторяются в каждой строке
+        node_uuids = [n.node_uuid for n in nodes_info]
+        paginated = [
+            item.model_copy(update={'node_traffic': [item.node_traffic.get(uuid, 0) for uuid in node_uuids]})
+            for item in paginated
+        ]
+
     return TrafficUsageResponse(
         items=paginated,
         nodes=nodes_info,
@@ -603,8 +615,10 @@ async def export_traffic_csv(
     node_thr = request.node_threshold_gb or 0
     has_risk = total_thr > 0 or node_thr > 0
 
-    # Build CSV rows
-    rows: list[dict] = []
+    # Build CSV rows and write each one as soon as it is ready
+    output = io.StringIO()
+    writer: csv.DictWriter | None = None
+    exported = 0
     for item in items:
         row: dict = {
             'User ID': item.user_id,
@@ -660,14 +674,12 @@ async def export_traffic_csv(
             row['Risk Ratio'] = round(ratio, 3)
             row['Risk GB/day'] = round(daily_total if total_ratio >= max_node_ratio else worst_node_daily, 4)
 
-        rows.append(row)
+        if writer is None:
+            writer = csv.DictWriter(output, fieldnames=row.keys())
+            writer.writeheader()
+        writer.writerow(row)
+        exported += 1
 
-    # Generate CSV
-    output = io.StringIO()
-    if rows:
-        writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
     csv_bytes = output.getvalue().encode('utf-8-sig')
 
     timestamp = datetime.now(UTC).strftime('%Y%m%d_%H%M%S')
@@ -682,7 +694,7 @@ async def export_traffic_csv(
             await bot.send_document(
                 chat_id=admin.telegram_id,
                 document=BufferedInputFile(csv_bytes, filename=filename),
-                caption=f'Traffic usage report ({period_label})\nUsers: {len(rows)}',
+                caption=f'Traffic usage report ({period_label})\nUsers: {exported}',
             )
     except Exception:
         logger.error('Failed to send CSV to admin', telegram_id=admin.telegram_id, exc_info=True)
@@ -691,4 +703,4 @@ async def export_traffic_csv(
             detail='Failed to send CSV report. Please try again later.',
         )
 
-    return ExportCsvResponse(success=True, message=f'CSV sent ({len(rows)} users)')
+    return ExportCsvResponse(success=True, message=f'CSV sent ({exported} users)')
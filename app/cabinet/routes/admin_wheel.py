@@ -7,6 +7,7 @@ from datetime import datetime
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import ConfigDict, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cabinet.dependencies import get_cabinet_db, get_current_admin_user
@@ -39,6 +40,8 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix='/admin/wheel', tags=['Admin Fortune Wheel'])
 
+_prize_admin_list_adapter = TypeAdapter(list[WheelPrizeAdminResponse], config=ConfigDict(defer_build=True))
+
 
 @router.get('/config', response_model=AdminWheelConfigResponse)
 async def get_admin_wheel_config(
@@ -49,27 +52,7 @@ async def get_admin_wheel_config(
     config = await get_or_create_wheel_config(db)
     prizes = await get_wheel_prizes(db, config.id, active_only=False)
 
-    prizes_response = [
-        WheelPrizeAdminResponse(
-            id=p.id,
-            config_id=p.config_id,
-            prize_type=p.prize_type,
-            prize_value=p.prize_value,
-            display_name=p.display_name,
-            emoji=p.emoji,
-            color=p.color,
-            prize_value_kopeks=p.prize_value_kopeks,
-            sort_order=p.sort_order,
-            manual_probability=p.manual_probability,
-            is_active=p.is_active,
-            promo_balance_bonus_kopeks=p.promo_balance_bonus_kopeks or 0,
-            promo_subscription_days=p.promo_subscription_days or 0,
-            promo_traffic_gb=p.promo_traffic_gb or 0,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        )
-        for p in prizes
-    ]
+    prizes_response = _prize_admin_list_adapter.validate_python(prizes, from_attributes=True)
 
     return AdminWheelConfigResponse(
         id=config.id,
@@ -112,27 +95,7 @@ async def update_admin_wheel_config(
     # Возвращаем полную конфигурацию
     prizes = await get_wheel_prizes(db, config.id, active_only=False)
 
-    prizes_response = [
-        WheelPrizeAdminResponse(
-            id=p.id,
-            config_id=p.config_id,
-            prize_type=p.prize_type,
-            prize_value=p.prize_value,
-            display_name=p.display_name,
-            emoji=p.emoji,
-            color=p.color,
-            prize_value_kopeks=p.prize_value_kopeks,
-            sort_order=p.sort_order,
-            manual_probability=p.manual_probability,
-            is_active=p.is_active,
-            promo_balance_bonus_kopeks=p.promo_balance_bonus_kopeks or 0,
-            promo_subscription_days=p.promo_subscription_days or 0,
-            promo_traffic_gb=p.promo_traffic_gb or 0,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        )
-        for p in prizes
-    ]
+    prizes_response = _prize_admin_list_adapter.validate_python(prizes, from_attributes=True)
 
     return AdminWheelConfigResponse(
         id=config.id,
@@ -162,27 +125,7 @@ async def get_prizes(
     config = await get_or_create_wheel_config(db)
     prizes = await get_wheel_prizes(db, config.id, active_only=False)
 
-    return [
-        WheelPrizeAdminResponse(
-            id=p.id,
-            config_id=p.config_id,
-            prize_type=p.prize_type,
-            prize_value=p.prize_value,
-            display_name=p.display_name,
-            emoji=p.emoji,
-            color=p.color,
-            prize_value_kopeks=p.prize_value_kopeks,
-            sort_order=p.sort_order,
-            manual_probability=p.manual_probability,
-            is_active=p.is_active,
-            promo_balance_bonus_kopeks=p.promo_balance_bonus_kopeks or 0,
-            promo_subscription_days=p.promo_subscription_days or 0,
-            promo_traffic_gb=p.promo_traffic_gb or 0,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        )
-        for p in prizes
-    ]
+    return _prize_admin_list_adapter.validate_python(prizes, from_attributes=True)
 
 
 @router.post('/prizes', response_model=WheelPrizeAdminResponse, status_code=status.HTTP_201_CREATED)
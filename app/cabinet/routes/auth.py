@@ -940,13 +940,7 @@ async def refresh_token(
             detail='Invalid or expired refresh token',
         )
 
-    try:
-        user_id = int(payload.get('sub'))
-    except (TypeError, ValueError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail='Invalid token payload',
-        )
+    user_id = payload['sub']
 
     # Verify token exists in database and is not revoked
     token_hash = hashlib.sha256(request.refresh_token.encode()).hexdigest()
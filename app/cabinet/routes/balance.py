@@ -39,6 +39,7 @@ from ..schemas.balance import (
     TransactionListResponse,
     TransactionResponse,
 )
+from ..services.telegram_api import get_telegram_client
 
 
 logger = structlog.get_logger(__name__)
@@ -263,41 +264,41 @@ async def create_stars_invoice(
         bot_token = settings.BOT_TOKEN
         api_url = f'https://api.telegram.org/bot{bot_token}/createInvoiceLink'
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                api_url,
-                json={
-                    'title': 'Пополнение баланса VPN',
-                    'description': f'Пополнение баланса на {amount_rubles:.2f} ₽ ({stars_amount} ⭐)',
-                    'payload': payload,
-                    'provider_token': '',  # Empty for Stars
-                    'currency': 'XTR',
-                    'prices': [{'label': 'Пополнение баланса', 'amount': stars_amount}],
-                },
-            )
+        client = get_telegram_client()
+        response = await client.post(
+            api_url,
+            json={
+                'title': 'Пополнение баланса VPN',
+                'description': f'Пополнение баланса на {amount_rubles:.2f} ₽ ({stars_amount} ⭐)',
+                'payload': payload,
+                'provider_token': '',  # Empty for Stars
+                'currency': 'XTR',
+                'prices': [{'label': 'Пополнение баланса', 'amount': stars_amount}],
+            },
+        )
 
-            result = response.json()
+        result = response.json()
 
-            if not result.get('ok'):
-                logger.error('Telegram API error', result=result)
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail='Failed to create Stars invoice',
-                )
-
-            invoice_url = result['result']
-            logger.info(
-                'Created Stars invoice for balance top-up: user=, amount= kopeks, stars',
-                user_id=user.id,
-                amount_kopeks=request.amount_kopeks,
-                stars_amount=stars_amount,
+        if not result.get('ok'):
+            logger.error('Telegram API error', result=result)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail='Failed to create Stars invoice',
             )
 
-            return StarsInvoiceResponse(
-                invoice_url=invoice_url,
-                stars_amount=stars_amount,
-                amount_kopeks=request.amount_kopeks,
-            )
+        invoice_url = result['result']
+        logger.info(
+            'Created Stars invoice for balance top-up: user=, amount= kopeks, stars',
+            user_id=user.id,
+            amount_kopeks=request.amount_kopeks,
+            stars_amount=stars_amount,
+        )
+
+        return StarsInvoiceResponse(
+            invoice_url=invoice_url,
+            stars_amount=stars_amount,
+            amount_kopeks=request.amount_kopeks,
+        )
 
     except httpx.HTTPError as e:
         logger.error('HTTP error creating Stars invoice', error=e)
@@ -1,6 +1,8 @@
 """Media upload/download routes for cabinet tickets."""
 
 import mimetypes
+from collections.abc import AsyncIterator
+from functools import lru_cache
 
 import structlog
 from aiogram import Bot
@@ -8,6 +10,7 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.types import BufferedInputFile
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.config import settings
@@ -22,6 +25,8 @@ router = APIRouter(prefix='/media', tags=['Cabinet Media'])
 
 ALLOWED_MEDIA_TYPES = {'photo', 'video', 'document'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 class MediaUploadResponse(BaseModel):
@@ -33,6 +38,22 @@ class MediaUploadResponse(BaseModel):
     media_url: str
 
 
+@lru_cache(maxsize=1)
+def _get_bot() -> Bot:
+    """Получить Bot для загрузки медиа (переиспользуется, чтобы не терять keep-alive соединения с Bot API)."""
+    return Bot(
+        token=settings.BOT_TOKEN,
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+
+
+async def close_media_bot() -> None:
+    """Close the cached media Bot session. Called on application shutdown."""
+    if _get_bot.cache_info().currsize:
+        await _get_bot().session.close()
+        _get_bot.cache_clear()
+
+
 def _resolve_target_chat_id() -> int:
     """Get chat ID for uploading files (notification channel or first admin)."""
     chat_id = settings.get_admin_notifications_chat_id()
@@ -72,20 +93,28 @@ async def upload_media(
             detail=f'Unsupported media type. Allowed: {", ".join(ALLOWED_MEDIA_TYPES)}',
         )
 
-    # Read and validate file
-    file_bytes = await file.read()
-    if not file_bytes:
+    # Read in chunks so an oversized upload is rejected before it is buffered in full
+    too_large_error = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f'File too large. Maximum size: {MAX_FILE_SIZE // 1024 // 1024}MB',
+    )
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise too_large_error
+
+    chunks: list[bytes] = []
+    total_size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > MAX_FILE_SIZE:
+            raise too_large_error
+        chunks.append(chunk)
+
+    if not total_size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail='File is empty',
         )
 
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f'File too large. Maximum size: {MAX_FILE_SIZE // 1024 // 1024}MB',
-        )
-
     # Validate content type for photos
     if media_type_normalized == 'photo':
         allowed_image_types = {'image/jpeg', 'image/png', 'image/gif', 'image/webp'}
@@ -96,12 +125,9 @@ async def upload_media(
             )
 
     target_chat_id = _resolve_target_chat_id()
-    upload = BufferedInputFile(file_bytes, filename=file.filename or 'upload')
+    upload = BufferedInputFile(b''.join(chunks), filename=file.filename or 'upload')
 
-    bot = Bot(
-        token=settings.BOT_TOKEN,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+    bot = _get_bot()
 
     try:
         if media_type_normalized == 'photo':
@@ -146,8 +172,6 @@ async def upload_media(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Failed to upload media',
         ) from error
-    finally:
-        await bot.session.close()
 
 
 @router.get('/{file_id}', name='cabinet_download_media')
@@ -158,10 +182,7 @@ async def download_media(
     Download media file by file_id.
     Used to display images/documents in ticket messages.
     """
-    bot = Bot(
-        token=settings.BOT_TOKEN,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+    bot = _get_bot()
 
     try:
         file = await bot.get_file(file_id)
@@ -171,18 +192,33 @@ async def download_media(
                 detail='Media file not found',
             )
 
-        buffer = await bot.download_file(file.file_path)
-
-        if hasattr(buffer, 'seek'):
-            buffer.seek(0)
+        stream = bot.session.stream_content(
+            url=bot.session.api.file_url(bot.token, file.file_path),
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            raise_for_status=True,
+        )
+        # Первый чанк читаем до отправки заголовков, чтобы ошибки Bot API вернулись как 500
+        try:
+            first_chunk = await anext(stream, b'')
+        except BaseException:
+            await stream.aclose()
+            raise
 
-        content = buffer.read() if hasattr(buffer, 'read') else bytes(buffer)
         filename = file.file_path.split('/')[-1]
 
         media_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
 
-        return Response(
-            content=content,
+        async def _iter_content() -> AsyncIterator[bytes]:
+            try:
+                if first_chunk:
+                    yield first_chunk
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await stream.aclose()
+
+        return StreamingResponse(
+            _iter_content(),
             media_type=media_type,
             headers={
                 'Content-Disposition': f'inline; filename={filename}',
@@ -197,5 +233,3 @@ async def download_media(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail='Failed to download media',
         ) from error
-    finally:
-        await bot.session.close()
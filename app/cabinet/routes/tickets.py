@@ -32,8 +32,11 @@ router = APIRouter(prefix='/tickets', tags=['Cabinet Tickets'])
 
 
 def _message_to_response(message: TicketMessage) -> TicketMessageResponse:
-    """Convert TicketMessage to response."""
-    return TicketMessageResponse(
+    """Convert TicketMessage to response.
+
+    Поля берутся из строки БД как есть, поэтому модель собирается без валидации.
+    """
+    return TicketMessageResponse.model_construct(
         id=message.id,
         message_text=message.message_text or '',
         is_from_admin=message.is_from_admin,
@@ -54,7 +57,7 @@ def _ticket_to_response(ticket: Ticket, include_last_message: bool = True) -> Ti
         last_msg = max(ticket.messages, key=lambda m: m.created_at)
         last_message = _message_to_response(last_msg)
 
-    return TicketResponse(
+    return TicketResponse.model_construct(
         id=ticket.id,
         title=ticket.title or f'Ticket #{ticket.id}',
         status=ticket.status,
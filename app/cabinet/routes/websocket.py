@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
+import time
+from collections.abc import Iterable
 
+import orjson
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
@@ -12,6 +15,7 @@ from app.cabinet.auth.jwt_handler import get_token_payload
 from app.config import settings
 from app.database.crud.user import get_user_by_id
 from app.database.database import AsyncSessionLocal
+from app.utils.cache import cache, cache_key
 
 
 logger = structlog.get_logger(__name__)
@@ -19,27 +23,68 @@ logger = structlog.get_logger(__name__)
 router = APIRouter()
 
 
+# Пропущенные (пока пользователь был офлайн) важные уведомления доставляются при переподключении
+WS_MISSED_MAX_MESSAGES = 50
+WS_MISSED_TTL_SECONDS = 24 * 60 * 60
+
+
+def _dumps(message: dict) -> str:
+    """Сериализовать исходящее сообщение (datetime как str(), как раньше в json.dumps(default=str))."""
+    return orjson.dumps(message, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+
+
+class _Connection:
+    """WebSocket подключение с собственной очередью исходящих сообщений."""
+
+    __slots__ = ('queue', 'relay_task', 'user_id', 'websocket')
+
+    def __init__(self, websocket: WebSocket, user_id: int):
+        self.websocket = websocket
+        self.user_id = user_id
+        # При переполнении очереди клиент считается медленным и отключается
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=settings.get_cabinet_ws_send_queue_size())
+        self.relay_task: asyncio.Task[None] | None = None
+
+
 class CabinetConnectionManager:
-    """Менеджер WebSocket подключений для кабинета."""
+    """Менеджер WebSocket подключений для кабинета.
+
+    Отправка не ждёт сокет: сообщение кладётся в очередь подключения, а
+    отдельная relay-задача пишет его в сокет. Медленный клиент не тормозит
+    рассылку остальным - при переполнении очереди он отключается.
+
+    Реестры меняются только синхронным кодом без await внутри, поэтому в
+    рамках одного event loop операции атомарны и отдельный лок не нужен.
+    Наборы подключений - неизменяемые кортежи, которые заменяются целиком
+    (copy-on-write), так что рассылка берёт их без копирования.
+    """
 
     def __init__(self):
-        # user_id -> set of websocket connections
-        self._user_connections: dict[int, set[WebSocket]] = {}
-        # admin user_ids -> set of websocket connections
-        self._admin_connections: dict[int, set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
-
-    async def connect(self, websocket: WebSocket, user_id: int, is_admin: bool) -> None:
-        """Зарегистрировать подключение."""
-        async with self._lock:
-            if user_id not in self._user_connections:
-                self._user_connections[user_id] = set()
-            self._user_connections[user_id].add(websocket)
-
-            if is_admin:
-                if user_id not in self._admin_connections:
-                    self._admin_connections[user_id] = set()
-                self._admin_connections[user_id].add(websocket)
+        # user_id -> tuple of connections
+        self._user_connections: dict[int, tuple[_Connection, ...]] = {}
+        # Плоский кортеж подключений админов: рассылка идёт одним проходом без вложенных наборов
+        self._admin_connections: tuple[_Connection, ...] = ()
+        # Фоновые закрытия отключённых медленных клиентов
+        self._closing_tasks: set[asyncio.Task[None]] = set()
+
+    async def connect(self, websocket: WebSocket, user_id: int, is_admin: bool) -> _Connection:
+        """Зарегистрировать подключение.
+
+        Пропущенные уведомления из Redis ставятся в очередь отдельными
+        сообщениями. Relay-задачу (``relay``) запускает и отменяет обработчик
+        подключения.
+        """
+        conn = _Connection(websocket, user_id)
+
+        self._user_connections[user_id] = (*self._user_connections.get(user_id, ()), conn)
+        if is_admin:
+            self._admin_connections = (*self._admin_connections, conn)
+
+        # Читаем Redis уже после регистрации: уведомление, пришедшее во время чтения,
+        # попадёт в очередь, а не останется в Redis до следующего подключения.
+        # Новые сообщения в начале списка - отдаём в хронологическом порядке
+        for data in reversed(await cache.lpop_all(cache_key('cabinet_ws_missed', user_id))):
+            await self.send_to_user_raw(user_id, data)
 
         logger.debug(
             'Cabinet WS connected: user_id is_admin total_users',
@@ -47,85 +92,175 @@ class CabinetConnectionManager:
             is_admin=is_admin,
             user_connections_count=len(self._user_connections),
         )
+        return conn
 
     async def disconnect(self, websocket: WebSocket, user_id: int) -> None:
         """Отменить регистрацию подключения."""
-        async with self._lock:
-            if user_id in self._user_connections:
-                self._user_connections[user_id].discard(websocket)
-                if not self._user_connections[user_id]:
-                    del self._user_connections[user_id]
+        conn = next((c for c in self._user_connections.get(user_id, ()) if c.websocket is websocket), None)
+        if conn is None:
+            return
+        self._unregister(conn)
 
-            if user_id in self._admin_connections:
-                self._admin_connections[user_id].discard(websocket)
-                if not self._admin_connections[user_id]:
-                    del self._admin_connections[user_id]
+        if conn.relay_task is not None:
+            conn.relay_task.cancel()
 
         logger.debug('Cabinet WS disconnected: user_id', user_id=user_id)
 
-    async def send_to_user(self, user_id: int, message: dict) -> None:
-        """Отправить сообщение конкретному пользователю."""
-        # Snapshot connections under the lock to avoid mutation during iteration
-        async with self._lock:
-            connections = list(self._user_connections.get(user_id, set()))
+    def _unregister(self, conn: _Connection) -> None:
+        """Убрать подключение из реестров."""
+        connections = self._user_connections.get(conn.user_id)
+        if connections is None:
+            return
+        remaining = tuple(c for c in connections if c is not conn)
+        if len(remaining) == len(connections):
+            return
+        if remaining:
+            self._user_connections[conn.user_id] = remaining
+        else:
+            del self._user_connections[conn.user_id]
+
+        if conn in self._admin_connections:
+            self._admin_connections = tuple(c for c in self._admin_connections if c is not conn)
+
+    async def relay(self, conn: _Connection) -> None:
+        """Переносить сообщения из очереди подключения в сокет (по одному фрейму на сообщение)."""
+        try:
+            while True:
+                data = await conn.queue.get()
+                await conn.websocket.send_text(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning('Failed to send to user', user_id=conn.user_id, e=e)
+            self._unregister(conn)
+
+    def _evict(self, connections: list[_Connection]) -> None:
+        """Отключить клиентов, которые не успевают забирать сообщения.
+
+        Сокеты закрываются параллельно в фоне.
+        """
+        for conn in connections:
+            self._unregister(conn)
+            logger.warning('Cabinet WS send queue overflow, dropping connection', user_id=conn.user_id)
+            if conn.relay_task is not None:
+                conn.relay_task.cancel()
+
+        task = asyncio.create_task(self._close_slow([conn.websocket for conn in connections]))
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    @staticmethod
+    async def _close_slow(websockets: list[WebSocket]) -> None:
+        results = await asyncio.gather(
+            *(ws.close(code=1013, reason='Client too slow') for ws in websockets),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug('Failed to close slow cabinet WS', e=result)
+
+    @staticmethod
+    def _enqueue(connections: Iterable[_Connection], data: str) -> list[_Connection]:
+        """Положить сообщение в очереди подключений, вернуть переполненные."""
+        overflowed = []
+        for conn in connections:
+            try:
+                conn.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                overflowed.append(conn)
+        return overflowed
+
+    def has_user_connection(self, user_id: int) -> bool:
+        """Есть ли у пользователя открытое подключение (позволяет не собирать сообщение зря)."""
+        return user_id in self._user_connections
+
+    def has_admin_connections(self) -> bool:
+        """Подключён ли хотя бы один админ."""
+        return bool(self._admin_connections)
+
+    async def send_to_user(self, user_id: int, message: dict, *, persist_if_offline: bool = False) -> None:
+        """Отправить сообщение конкретному пользователю.
+
+        С ``persist_if_offline`` сообщение для офлайн-пользователя сохраняется
+        в Redis и будет доставлено при следующем подключении. Только для событий,
+        которые можно безопасно показать позже: без абсолютных значений
+        состояния вроде текущего баланса.
+        """
+        if not self.has_user_connection(user_id):
+            if persist_if_offline:
+                await cache.lpush_capped(
+                    cache_key('cabinet_ws_missed', user_id),
+                    _dumps(message),
+                    max_length=WS_MISSED_MAX_MESSAGES,
+                    expire=WS_MISSED_TTL_SECONDS,
+                )
+            return
+        await self.send_to_user_raw(user_id, _dumps(message))
+
+    async def send_to_user_raw(self, user_id: int, data: str) -> None:
+        """Отправить пользователю уже сериализованное JSON-сообщение."""
+        connections = self._user_connections.get(user_id, ())
 
         if not connections:
             return
 
-        disconnected = set()
-        data = json.dumps(message, default=str, ensure_ascii=False)
-
-        for ws in connections:
+        # Обычно у пользователя одна вкладка - обходимся без списка переполненных
+        if len(connections) == 1:
             try:
-                await ws.send_text(data)
-            except Exception as e:
-                logger.warning('Failed to send to user', user_id=user_id, e=e)
-                disconnected.add(ws)
+                connections[0].queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._evict(list(connections))
+            return
 
-        # Cleanup disconnected
-        if disconnected:
-            async with self._lock:
-                for ws in disconnected:
-                    self._user_connections.get(user_id, set()).discard(ws)
+        overflowed = self._enqueue(connections, data)
+        if overflowed:
+            self._evict(overflowed)
 
     async def send_to_admins(self, message: dict) -> None:
         """Отправить сообщение всем админам."""
-        # Snapshot connections under the lock to avoid mutation during iteration
-        async with self._lock:
-            if not self._admin_connections:
-                return
-            # Create a snapshot: list of (user_id, list of websockets)
-            admin_snapshot = [(user_id, list(connections)) for user_id, connections in self._admin_connections.items()]
-
-        data = json.dumps(message, default=str, ensure_ascii=False)
-        disconnected_by_user: dict[int, set[WebSocket]] = {}
-
-        for user_id, connections in admin_snapshot:
-            for ws in connections:
-                try:
-                    await ws.send_text(data)
-                except Exception as e:
-                    logger.warning('Failed to send to admin', user_id=user_id, e=e)
-                    if user_id not in disconnected_by_user:
-                        disconnected_by_user[user_id] = set()
-                    disconnected_by_user[user_id].add(ws)
-
-        # Cleanup disconnected
-        if disconnected_by_user:
-            async with self._lock:
-                for user_id, ws_set in disconnected_by_user.items():
-                    for ws in ws_set:
-                        self._admin_connections.get(user_id, set()).discard(ws)
+        # Сериализуем один раз на всю рассылку, только если есть получатели
+        if not self.has_admin_connections():
+            return
+        await self.send_to_admins_raw(_dumps(message))
+
+    async def send_to_admins_raw(self, data: str) -> None:
+        """Отправить всем админам уже сериализованное JSON-сообщение."""
+        connections = self._admin_connections
+        if not connections:
+            return
+
+        overflowed = self._enqueue(connections, data)
+        if overflowed:
+            self._evict(overflowed)
 
 
 # Глобальный менеджер подключений
 cabinet_ws_manager = CabinetConnectionManager()
 
 
+# Кеш успешно проверенных токенов: переподключения клиента не ходят в БД.
+# TTL короткий, чтобы бан/деактивация вступали в силу быстро.
+WS_TOKEN_CACHE_TTL = 30
+_WS_TOKEN_CACHE_PRUNE_SIZE = 1024
+# blake2b(token) -> (expires_at по monotonic, user_id, is_admin)
+_ws_token_cache: dict[bytes, tuple[float, int, bool]] = {}
+
+
+def _prune_ws_token_cache(now: float) -> None:
+    """Удалить протухшие записи, если кеш разросся."""
+    if len(_ws_token_cache) < _WS_TOKEN_CACHE_PRUNE_SIZE:
+        return
+    for key in [key for key, entry in _ws_token_cache.items() if entry[0] <= now]:
+        del _ws_token_cache[key]
+
+
 async def verify_cabinet_ws_token(token: str) -> tuple[int | None, bool]:
     """
     Проверить JWT токен для WebSocket.
 
+    Подпись и срок действия проверяются всегда, а результат проверки
+    пользователя в БД кешируется на WS_TOKEN_CACHE_TTL секунд.
+
     Returns:
         tuple[user_id, is_admin] или (None, False) если токен невалидный
     """
@@ -136,25 +271,36 @@ async def verify_cabinet_ws_token(token: str) -> tuple[int | None, bool]:
     if not payload:
         return None, False
 
-    try:
-        user_id = int(payload.get('sub'))
-    except (TypeError, ValueError):
-        return None, False
+    now = time.monotonic()
+    token_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _ws_token_cache.get(token_key)
+    if cached is not None and cached[0] > now:
+        return cached[1], cached[2]
+
+    user_id = payload['sub']
 
     try:
         async with AsyncSessionLocal() as db:
             user = await get_user_by_id(db, user_id)
             if not user or user.status != 'active':
                 return None, False
-
-            is_admin = settings.is_admin(
-                telegram_id=user.telegram_id, email=user.email if user.email_verified else None
-            )
-            return user_id, is_admin
+            # Забираем нужные поля и сразу отдаём соединение в пул
+            telegram_id, email, email_verified = user.telegram_id, user.email, user.email_verified
     except (TimeoutError, OSError, ConnectionRefusedError) as e:
         logger.error('Database connection error in WS token verification', e=str(e)[:200])
         return None, False
 
+    is_admin = settings.is_admin(telegram_id=telegram_id, email=email if email_verified else None)
+
+    _prune_ws_token_cache(now)
+    _ws_token_cache[token_key] = (now + WS_TOKEN_CACHE_TTL, user_id, is_admin)
+    return user_id, is_admin
+
+
+# Единственное сообщение от клиента - ping; частые варианты сериализации сравниваем как строки
+_PING_FRAMES = frozenset({'{"type":"ping"}', '{"type": "ping"}'})
+_PONG_FRAME = '{"type":"pong"}'
+
 
 @router.websocket('/ws')
 async def cabinet_websocket_endpoint(websocket: WebSocket):
@@ -190,10 +336,10 @@ async def cabinet_websocket_endpoint(websocket: WebSocket):
         return
 
     # Регистрируем подключение
-    await cabinet_ws_manager.connect(websocket, user_id, is_admin)
+    conn = await cabinet_ws_manager.connect(websocket, user_id, is_admin)
 
     try:
-        # Приветственное сообщение
+        # Приветственное сообщение уходит первым, до пропущенных уведомлений из очереди
         await websocket.send_json(
             {
                 'type': 'connected',
@@ -202,28 +348,38 @@ async def cabinet_websocket_endpoint(websocket: WebSocket):
             }
         )
 
-        # Обрабатываем входящие сообщения
-        while True:
+        # Relay-задача живёт в TaskGroup обработчика: выход из него по любой причине её отменяет
+        async with asyncio.TaskGroup() as tg:
+            conn.relay_task = tg.create_task(cabinet_ws_manager.relay(conn))
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
-
-                # Ping/pong для keepalive
-                if message.get('type') == 'ping':
-                    await websocket.send_json({'type': 'pong'})
-
-            except json.JSONDecodeError:
-                logger.warning('Cabinet WS: Invalid JSON from user', user_id=user_id)
-            except WebSocketDisconnect:
-                break
-            except Exception as e:
-                logger.exception('Cabinet WS error for user', user_id=user_id, e=e)
-                break
-
-    except WebSocketDisconnect:
+                # Обрабатываем входящие сообщения
+                while True:
+                    try:
+                        data = await websocket.receive_text()
+
+                        # Ping/pong для keepalive: обычный ping узнаём без разбора JSON
+                        if data in _PING_FRAMES:
+                            await websocket.send_text(_PONG_FRAME)
+                            continue
+
+                        message = orjson.loads(data)
+                        if message.get('type') == 'ping':
+                            await websocket.send_text(_PONG_FRAME)
+
+                    except orjson.JSONDecodeError:
+                        logger.warning('Cabinet WS: Invalid JSON from user', user_id=user_id)
+                    except WebSocketDisconnect:
+                        break
+                    except Exception as e:
+                        logger.exception('Cabinet WS error for user', user_id=user_id, e=e)
+                        break
+            finally:
+                conn.relay_task.cancel()
+
+    except* WebSocketDisconnect:
         logger.debug('Cabinet WS disconnected: user_id', user_id=user_id)
-    except Exception as e:
-        logger.exception('Cabinet WS error', e=e)
+    except* Exception as eg:
+        logger.exception('Cabinet WS error', e=eg)
     finally:
         await cabinet_ws_manager.disconnect(websocket, user_id)
 
@@ -238,11 +394,14 @@ async def notify_user_ticket_reply(user_id: int, ticket_id: int, message: str) -
             'ticket_id': ticket_id,
             'message': message,
         },
+        persist_if_offline=True,
     )
 
 
 async def notify_admins_new_ticket(ticket_id: int, title: str, user_id: int) -> None:
     """Уведомить админов о новом тикете."""
+    if not cabinet_ws_manager.has_admin_connections():
+        return
     await cabinet_ws_manager.send_to_admins(
         {
             'type': 'ticket.new',
@@ -255,6 +414,8 @@ async def notify_admins_new_ticket(ticket_id: int, title: str, user_id: int) ->
 
 async def notify_admins_ticket_reply(ticket_id: int, message: str, user_id: int) -> None:
     """Уведомить админов об ответе пользователя."""
+    if not cabinet_ws_manager.has_admin_connections():
+        return
     await cabinet_ws_manager.send_to_admins(
         {
             'type': 'ticket.user_reply',
@@ -277,6 +438,8 @@ async def notify_user_balance_topup(
     description: str = '',
 ) -> None:
     """Уведомить пользователя о пополнении баланса."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -297,6 +460,8 @@ async def notify_user_balance_change(
     description: str = '',
 ) -> None:
     """Уведомить пользователя об изменении баланса."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -321,6 +486,8 @@ async def notify_user_subscription_activated(
     tariff_name: str = '',
 ) -> None:
     """Уведомить пользователя об активации подписки."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -337,6 +504,8 @@ async def notify_user_subscription_expiring(
     expires_at: str,
 ) -> None:
     """Уведомить пользователя о скором истечении подписки."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -349,6 +518,8 @@ async def notify_user_subscription_expiring(
 
 async def notify_user_subscription_expired(user_id: int) -> None:
     """Уведомить пользователя об истечении подписки."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -363,6 +534,8 @@ async def notify_user_subscription_renewed(
     amount_kopeks: int = 0,
 ) -> None:
     """Уведомить пользователя о продлении подписки."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -381,6 +554,8 @@ async def notify_user_devices_purchased(
     amount_kopeks: int,
 ) -> None:
     """Уведомить пользователя о покупке устройств."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -400,6 +575,8 @@ async def notify_user_traffic_purchased(
     amount_kopeks: int,
 ) -> None:
     """Уведомить пользователя о покупке трафика."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -423,6 +600,8 @@ async def notify_user_autopay_success(
     new_expires_at: str,
 ) -> None:
     """Уведомить пользователя об успешном автопродлении."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -439,6 +618,8 @@ async def notify_user_autopay_failed(
     reason: str = '',
 ) -> None:
     """Уведомить пользователя о неудачном автопродлении."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -454,6 +635,8 @@ async def notify_user_autopay_insufficient_funds(
     balance_kopeks: int,
 ) -> None:
     """Уведомить о недостатке средств для автопродления."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -473,6 +656,8 @@ async def notify_user_autopay_insufficient_funds(
 
 async def notify_user_ban(user_id: int, reason: str = '') -> None:
     """Уведомить пользователя о блокировке."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -484,6 +669,8 @@ async def notify_user_ban(user_id: int, reason: str = '') -> None:
 
 async def notify_user_unban(user_id: int) -> None:
     """Уведомить пользователя о разблокировке."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -494,6 +681,8 @@ async def notify_user_unban(user_id: int) -> None:
 
 async def notify_user_warning(user_id: int, message: str) -> None:
     """Уведомить пользователя о предупреждении."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -514,6 +703,8 @@ async def notify_user_referral_bonus(
     referral_name: str = '',
 ) -> None:
     """Уведомить пользователя о реферальном бонусе."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -530,6 +721,8 @@ async def notify_user_referral_registered(
     referral_name: str = '',
 ) -> None:
     """Уведомить пользователя о регистрации нового реферала."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -550,6 +743,8 @@ async def notify_user_daily_debit(
     new_balance_kopeks: int,
 ) -> None:
     """Уведомить о ежедневном списании."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -564,6 +759,8 @@ async def notify_user_daily_debit(
 
 async def notify_user_traffic_reset(user_id: int) -> None:
     """Уведомить о сбросе трафика."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -578,6 +775,8 @@ async def notify_user_payment_received(
     payment_method: str = '',
 ) -> None:
     """Уведомить о полученном платеже."""
+    if not cabinet_ws_manager.has_user_connection(user_id):
+        return
     await cabinet_ws_manager.send_to_user(
         user_id,
         {
@@ -8,7 +8,7 @@ import time
 import httpx
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cabinet.dependencies import get_cabinet_db, get_current_cabinet_user
@@ -21,6 +21,7 @@ from app.cabinet.schemas.wheel import (
     WheelConfigResponse,
     WheelPrizeDisplay,
 )
+from app.cabinet.services.telegram_api import get_telegram_client
 from app.config import settings
 from app.database.crud.wheel import (
     get_or_create_wheel_config,
@@ -36,6 +37,8 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix='/wheel', tags=['Fortune Wheel'])
 
+_prize_display_list_adapter = TypeAdapter(list[WheelPrizeDisplay])
+
 
 @router.get('/config', response_model=WheelConfigResponse)
 async def get_wheel_config(
@@ -50,16 +53,7 @@ async def get_wheel_config(
     # Проверяем доступность
     availability = await wheel_service.check_availability(db, user)
 
-    prizes_display = [
-        WheelPrizeDisplay(
-            id=p.id,
-            display_name=p.display_name,
-            emoji=p.emoji,
-            color=p.color,
-            prize_type=p.prize_type,
-        )
-        for p in prizes
-    ]
+    prizes_display = _prize_display_list_adapter.validate_python(prizes, from_attributes=True)
 
     return WheelConfigResponse(
         is_enabled=config.is_enabled,
@@ -237,37 +231,35 @@ async def create_stars_invoice(
         bot_token = settings.BOT_TOKEN
         api_url = f'https://api.telegram.org/bot{bot_token}/createInvoiceLink'
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                api_url,
-                json={
-                    'title': 'Колесо удачи',
-                    'description': f'Спин колеса удачи ({stars_amount} ⭐)',
-                    'payload': payload,
-                    'provider_token': '',  # Пустой для Stars
-                    'currency': 'XTR',
-                    'prices': [{'label': 'Спин колеса', 'amount': stars_amount}],
-                },
-            )
-
-            result = response.json()
+        client = get_telegram_client()
+        response = await client.post(
+            api_url,
+            json={
+                'title': 'Колесо удачи',
+                'description': f'Спин колеса удачи ({stars_amount} ⭐)',
+                'payload': payload,
+                'provider_token': '',  # Пустой для Stars
+                'currency': 'XTR',
+                'prices': [{'label': 'Спин колеса', 'amount': stars_amount}],
+            },
+        )
 
-            if not result.get('ok'):
-                logger.error('Telegram API error', result=result)
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail='Ошибка создания инвойса',
-                )
+        result = response.json()
 
-            invoice_url = result['result']
-            logger.info(
-                'Created Stars invoice for wheel spin: user=, stars', user_id=user.id, stars_amount=stars_amount
+        if not result.get('ok'):
+            logger.error('Telegram API error', result=result)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail='Ошибка создания инвойса',
             )
 
-            return StarsInvoiceResponse(
-                invoice_url=invoice_url,
-                stars_amount=stars_amount,
-            )
+        invoice_url = result['result']
+        logger.info('Created Stars invoice for wheel spin: user=, stars', user_id=user.id, stars_amount=stars_amount)
+
+        return StarsInvoiceResponse(
+            invoice_url=invoice_url,
+            stars_amount=stars_amount,
+        )
 
     except httpx.HTTPError as e:
         logger.error('HTTP error creating invoice', error=e)
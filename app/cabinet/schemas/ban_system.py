@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # === Status ===
@@ -79,7 +79,7 @@ class BanUserListItem(BaseModel):
 class BanUsersListResponse(BaseModel):
     """Paginated list of users."""
 
-    users: list[BanUserListItem] = []
+    users: list[BanUserListItem] = Field(default_factory=list)
     total: int = 0
     offset: int = 0
     limit: int = 50
@@ -94,8 +94,8 @@ class BanUserDetailResponse(BaseModel):
     limit: int | None = None
     is_over_limit: bool = False
     blocked_count: int = 0
-    ips: list[BanUserIPInfo] = []
-    recent_requests: list[BanUserRequestLog] = []
+    ips: list[BanUserIPInfo] = Field(default_factory=list)
+    recent_requests: list[BanUserRequestLog] = Field(default_factory=list)
     network_type: str | None = None  # wifi, mobile, mixed
 
 
@@ -106,9 +106,9 @@ class BanPunishmentItem(BaseModel):
     """Punishment/ban entry."""
 
     id: int | None = None
-    user_id: str
+    user_id: str = ''
     uuid: str | None = None
-    username: str
+    username: str = ''
     reason: str | None = None
     punished_at: datetime
     enable_at: datetime | None = None
@@ -122,14 +122,14 @@ class BanPunishmentItem(BaseModel):
 class BanPunishmentsListResponse(BaseModel):
     """List of active punishments."""
 
-    punishments: list[BanPunishmentItem] = []
+    punishments: list[BanPunishmentItem] = Field(default_factory=list)
     total: int = 0
 
 
 class BanHistoryResponse(BaseModel):
     """Punishment history."""
 
-    items: list[BanPunishmentItem] = []
+    items: list[BanPunishmentItem] = Field(default_factory=list)
     total: int = 0
 
 
@@ -165,7 +165,7 @@ class BanNodeItem(BaseModel):
 class BanNodesListResponse(BaseModel):
     """List of nodes."""
 
-    nodes: list[BanNodeItem] = []
+    nodes: list[BanNodeItem] = Field(default_factory=list)
     total: int = 0
     online: int = 0
 
@@ -196,6 +196,8 @@ class BanAgentItem(BaseModel):
 class BanAgentsSummary(BaseModel):
     """Agents summary statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_agents: int = 0
     online_agents: int = 0
     total_sent: int = 0
@@ -209,7 +211,7 @@ class BanAgentsSummary(BaseModel):
 class BanAgentsListResponse(BaseModel):
     """List of agents."""
 
-    agents: list[BanAgentItem] = []
+    agents: list[BanAgentItem] = Field(default_factory=list)
     summary: BanAgentsSummary | None = None
     total: int = 0
     online: int = 0
@@ -221,6 +223,8 @@ class BanAgentsListResponse(BaseModel):
 class BanTrafficStats(BaseModel):
     """Traffic statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_bytes: int = 0
     upload_bytes: int = 0
     download_bytes: int = 0
@@ -257,7 +261,7 @@ class BanTrafficViolationItem(BaseModel):
 class BanTrafficViolationsResponse(BaseModel):
     """List of traffic violations."""
 
-    violations: list[BanTrafficViolationItem] = []
+    violations: list[BanTrafficViolationItem] = Field(default_factory=list)
     total: int = 0
 
 
@@ -275,8 +279,8 @@ class BanTrafficResponse(BaseModel):
 
     enabled: bool = False
     stats: dict[str, Any] | None = None
-    top_users: list[BanTrafficTopItem] = []
-    recent_violations: list[BanTrafficViolationItem] = []
+    top_users: list[BanTrafficTopItem] = Field(default_factory=list)
+    recent_violations: list[BanTrafficViolationItem] = Field(default_factory=list)
 
 
 # === Settings ===
@@ -298,7 +302,7 @@ class BanSettingDefinition(BaseModel):
 class BanSettingsResponse(BaseModel):
     """All settings response."""
 
-    settings: list[BanSettingDefinition] = []
+    settings: list[BanSettingDefinition] = Field(default_factory=list)
 
 
 class BanSettingUpdateRequest(BaseModel):
@@ -319,6 +323,8 @@ class BanWhitelistRequest(BaseModel):
 class BanReportTopViolator(BaseModel):
     """Top violator in report."""
 
+    model_config = ConfigDict(frozen=True)
+
     username: str
     count: int = 0
 
@@ -330,7 +336,7 @@ class BanReportResponse(BaseModel):
     current_users: int = 0
     current_ips: int = 0
     punishment_stats: dict[str, Any] | None = None
-    top_violators: list[BanReportTopViolator] = []
+    top_violators: list[BanReportTopViolator] = Field(default_factory=list)
 
 
 # === Health ===
@@ -346,19 +352,14 @@ class BanHealthComponent(BaseModel):
 
 
 class BanHealthResponse(BaseModel):
-    """Health status response."""
-
-    status: str  # healthy, degraded, unhealthy
-    uptime: int | None = None
-    components: list[BanHealthComponent] = []
+    """Health status response.
 
+    ``components`` is a list for /health and the raw upstream mapping for /health/detailed.
+    """
 
-class BanHealthDetailedResponse(BaseModel):
-    """Detailed health response."""
-
-    status: str
+    status: str  # healthy, degraded, unhealthy
     uptime: int | None = None
-    components: dict[str, Any] = {}
+    components: list[BanHealthComponent] | dict[str, Any] = Field(default_factory=list, union_mode='left_to_right')
 
 
 # === Agent History ===
@@ -367,6 +368,8 @@ class BanHealthDetailedResponse(BaseModel):
 class BanAgentHistoryItem(BaseModel):
     """Agent history item."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime
     sent_total: int = 0
     dropped_total: int = 0
@@ -374,6 +377,16 @@ class BanAgentHistoryItem(BaseModel):
     batches_total: int = 0
 
 
+class BanAgentHistorySeries(BaseModel):
+    """Agent history as parallel columns (one list per metric)."""
+
+    timestamps: list[datetime] = Field(default_factory=list)
+    sent_total: list[int] = Field(default_factory=list)
+    dropped_total: list[int] = Field(default_factory=list)
+    queue_size: list[int] = Field(default_factory=list)
+    batches_total: list[int] = Field(default_factory=list)
+
+
 class BanAgentHistoryResponse(BaseModel):
     """Agent history response."""
 
@@ -383,4 +396,5 @@ class BanAgentHistoryResponse(BaseModel):
     delta: dict[str, Any] | None = None
     first: dict[str, Any] | None = None
     last: dict[str, Any] | None = None
-    history: list[BanAgentHistoryItem] = []
+    history: list[BanAgentHistoryItem] = Field(default_factory=list)
+    series: BanAgentHistorySeries | None = None  # Заполняется вместо history при format=columns
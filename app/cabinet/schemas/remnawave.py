@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============ Status & Connection ============
@@ -33,6 +33,8 @@ class RemnaWaveStatusResponse(BaseModel):
 class SystemSummary(BaseModel):
     """System summary statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     users_online: int
     total_users: int
     active_connections: int
@@ -46,6 +48,8 @@ class SystemSummary(BaseModel):
 class ServerInfo(BaseModel):
     """Server hardware info."""
 
+    model_config = ConfigDict(frozen=True)
+
     cpu_cores: int
     cpu_physical_cores: int
     memory_total: int
@@ -58,6 +62,8 @@ class ServerInfo(BaseModel):
 class Bandwidth(BaseModel):
     """Realtime bandwidth statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     realtime_download: int
     realtime_upload: int
     realtime_total: int
@@ -66,6 +72,8 @@ class Bandwidth(BaseModel):
 class TrafficPeriod(BaseModel):
     """Traffic statistics for a period."""
 
+    model_config = ConfigDict(frozen=True)
+
     current: int
     previous: int
     difference: str | None = None
@@ -74,6 +82,8 @@ class TrafficPeriod(BaseModel):
 class TrafficPeriods(BaseModel):
     """Traffic statistics for multiple periods."""
 
+    model_config = ConfigDict(frozen=True)
+
     last_2_days: TrafficPeriod
     last_7_days: TrafficPeriod
     last_30_days: TrafficPeriod
@@ -289,6 +299,8 @@ class MigrationRequest(BaseModel):
 class MigrationStats(BaseModel):
     """Migration statistics."""
 
+    model_config = ConfigDict(frozen=True)
+
     source_uuid: str
     target_uuid: str
     total: int = 0
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 
 class PeriodPrice(BaseModel):
@@ -10,12 +10,11 @@ class PeriodPrice(BaseModel):
 
     days: int = Field(..., ge=1, description='Period in days')
     price_kopeks: int = Field(..., ge=0, description='Price in kopeks')
-    price_rubles: float | None = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        if self.price_rubles is None:
-            self.price_rubles = self.price_kopeks / 100
+    @computed_field
+    @property
+    def price_rubles(self) -> float:
+        return self.price_kopeks / 100
 
 
 class ServerTrafficLimit(BaseModel):
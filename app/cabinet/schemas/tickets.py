@@ -49,7 +49,7 @@ class TicketDetailResponse(BaseModel):
     updated_at: datetime
     closed_at: datetime | None = None
     is_reply_blocked: bool = False
-    messages: list[TicketMessageResponse] = []
+    messages: list[TicketMessageResponse] = Field(default_factory=list)
 
     class Config:
         from_attributes = True
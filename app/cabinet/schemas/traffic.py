@@ -1,15 +1,19 @@
 """Schemas for admin traffic usage."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TrafficNodeInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     node_uuid: str
     node_name: str
     country_code: str
 
 
 class UserTrafficItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: int
     telegram_id: int | None
     username: str | None
@@ -19,7 +23,7 @@ class UserTrafficItem(BaseModel):
     subscription_status: str | None
     traffic_limit_gb: float
     device_limit: int
-    node_traffic: dict[str, int]  # {node_uuid: total_bytes}
+    node_traffic: dict[str, int] | list[int]  # {node_uuid: total_bytes}; при format=columns - байты по порядку nodes
     total_bytes: int
 
 
@@ -35,6 +39,8 @@ class TrafficUsageResponse(BaseModel):
 
 
 class UserTrafficEnrichment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     devices_connected: int = 0
     total_spent_kopeks: int = 0
     subscription_start_date: str | None = None
@@ -43,6 +49,8 @@ class UserTrafficEnrichment(BaseModel):
 
 
 class TrafficEnrichmentResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     data: dict[int, UserTrafficEnrichment]
 
 
@@ -2,8 +2,13 @@
 
 from datetime import datetime
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+
+# HEX-цвет сектора колеса, общий для запросов создания и обновления приза
+HexColor = Annotated[str, StringConstraints(pattern=r'^#[0-9A-Fa-f]{6}$')]
 
 
 # ==================== ENUMS ====================
@@ -38,8 +43,7 @@ class WheelPrizeDisplay(BaseModel):
     color: str
     prize_type: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WheelConfigResponse(BaseModel):
@@ -112,8 +116,7 @@ class SpinHistoryItem(BaseModel):
     prize_value_kopeks: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SpinHistoryResponse(BaseModel):
@@ -149,8 +152,13 @@ class WheelPrizeAdminResponse(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+    @field_validator('promo_balance_bonus_kopeks', 'promo_subscription_days', 'promo_traffic_gb', mode='before')
+    @classmethod
+    def _null_promo_to_zero(cls, value):
+        # В старых записях promo-колонки могут быть NULL
+        return value or 0
 
 
 class AdminWheelConfigResponse(BaseModel):
@@ -172,8 +180,7 @@ class AdminWheelConfigResponse(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class UpdateWheelConfigRequest(BaseModel):
@@ -199,7 +206,7 @@ class CreatePrizeRequest(BaseModel):
     prize_value: int = Field(..., ge=0)
     display_name: str = Field(..., min_length=1, max_length=100)
     emoji: str = Field(default='🎁', max_length=10)
-    color: str = Field(default='#3B82F6', pattern=r'^#[0-9A-Fa-f]{6}$')
+    color: HexColor = '#3B82F6'
     prize_value_kopeks: int = Field(..., ge=0)
     sort_order: int = Field(default=0, ge=0)
     manual_probability: float | None = Field(None, ge=0, le=1)
@@ -216,7 +223,7 @@ class UpdatePrizeRequest(BaseModel):
     prize_value: int | None = Field(None, ge=0)
     display_name: str | None = Field(None, min_length=1, max_length=100)
     emoji: str | None = Field(None, max_length=10)
-    color: str | None = Field(None, pattern=r'^#[0-9A-Fa-f]{6}$')
+    color: HexColor | None = None
     prize_value_kopeks: int | None = Field(None, ge=0)
     sort_order: int | None = Field(None, ge=0)
     manual_probability: float | None = Field(None, ge=0, le=1)
@@ -248,13 +255,14 @@ class AdminSpinItem(BaseModel):
     is_applied: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
 
 
 class AdminSpinsResponse(BaseModel):
     """Список спинов для админки с пагинацией."""
 
+    model_config = ConfigDict(defer_build=True)
+
     items: list[AdminSpinItem]
     total: int
     page: int
@@ -265,6 +273,8 @@ class AdminSpinsResponse(BaseModel):
 class WheelStatisticsResponse(BaseModel):
     """Статистика колеса."""
 
+    model_config = ConfigDict(defer_build=True)
+
     total_spins: int
     total_revenue_kopeks: int
     total_payout_kopeks: int
@@ -1,15 +1,346 @@
 """Email service for sending verification and password reset emails."""
 
+import html
+import re
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import string
+import threading
+import time
+from email.message import EmailMessage
+from email.utils import formataddr
+from functools import lru_cache
 
 import structlog
 
 from app.config import settings
 
 
-logger = structlog.get_logger(__name__)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Локализованные тексты писем: {name} - ", <имя>" или пустая строка
+_VERIFICATION_TEXTS = {
+    'ru': {
+        'greeting': 'Здравствуйте{name}!',
+        'subject': 'Подтверждение email адреса',
+        'intro': 'Спасибо за регистрацию! Пожалуйста, подтвердите ваш email адрес, нажав на кнопку ниже:',
+        'button': 'Подтвердить email',
+        'or_copy': 'Или скопируйте и вставьте эту ссылку в браузер:',
+        'expires': 'Ссылка действительна в течение {expire_hours} часов.',
+        'ignore': 'Если вы не создавали аккаунт, просто проигнорируйте это письмо.',
+        'regards': 'С уважением,',
+    },
+    'en': {
+        'greeting': 'Hello{name}!',
+        'subject': 'Verify your email address',
+        'intro': 'Thank you for registering! Please verify your email address by clicking the button below:',
+        'button': 'Verify Email',
+        'or_copy': 'Or copy and paste this link in your browser:',
+        'expires': 'This link will expire in {expire_hours} hours.',
+        'ignore': "If you didn't create an account, you can safely ignore this email.",
+        'regards': 'Best regards,',
+    },
+    'zh': {
+        'greeting': '您好{name}!',
+        'subject': '验证您的邮箱地址',
+        'intro': '感谢您的注册！请点击下方按钮验证您的邮箱地址：',
+        'button': '验证邮箱',
+        'or_copy': '或将此链接复制并粘贴到浏览器中：',
+        'expires': '此链接将在 {expire_hours} 小时后过期。',
+        'ignore': '如果您没有创建账户，请忽略此邮件。',
+        'regards': '此致,',
+    },
+    'ua': {
+        'greeting': 'Вітаємо{name}!',
+        'subject': 'Підтвердження email адреси',
+        'intro': 'Дякуємо за реєстрацію! Будь ласка, підтвердіть вашу email адресу, натиснувши на кнопку нижче:',
+        'button': 'Підтвердити email',
+        'or_copy': 'Або скопіюйте та вставте це посилання в браузер:',
+        'expires': 'Посилання дійсне протягом {expire_hours} годин.',
+        'ignore': 'Якщо ви не створювали акаунт, просто проігноруйте цей лист.',
+        'regards': 'З повагою,',
+    },
+    'fa': {
+        'greeting': 'سلام{name}!',
+        'subject': 'تایید آدرس ایمیل',
+        'intro': 'از ثبت‌نام شما سپاسگزاریم! لطفاً با کلیک روی دکمه زیر ایمیل خود را تایید کنید:',
+        'button': 'تایید ایمیل',
+        'or_copy': 'یا این لینک را در مرورگر خود کپی و باز کنید:',
+        'expires': 'این لینک تا {expire_hours} ساعت معتبر است.',
+        'ignore': 'اگر شما این حساب را ایجاد نکرده‌اید، این ایمیل را نادیده بگیرید.',
+        'regards': 'با احترام،',
+    },
+}
+
+_VERIFICATION_HTML = string.Template(
+    """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .button {
+            display: inline-block;
+            padding: 12px 24px;
+            background-color: #007bff;
+            color: white !important;
+            text-decoration: none;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>$greeting</h2>
+        <p>$intro</p>
+        <a href="$full_url" class="button">$button</a>
+        <p>$or_copy</p>
+        <p><a href="$full_url">$full_url</a></p>
+        <p>$expires</p>
+        <p>$ignore</p>
+        <div class="footer">
+            <p>$regards<br>$from_name</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+)
+
+
+_PASSWORD_RESET_TEXTS = {
+    'ru': {
+        'greeting': 'Здравствуйте{name}!',
+        'subject': 'Сброс пароля',
+        'intro': 'Мы получили запрос на сброс вашего пароля. Нажмите на кнопку ниже, чтобы установить новый пароль:',
+        'button': 'Сбросить пароль',
+        'or_copy': 'Или скопируйте и вставьте эту ссылку в браузер:',
+        'expires': 'Ссылка действительна в течение {expire_hours} часов.',
+        'warning': 'Если вы не запрашивали сброс пароля, проигнорируйте это письмо или свяжитесь с поддержкой.',
+        'regards': 'С уважением,',
+    },
+    'en': {
+        'greeting': 'Hello{name}!',
+        'subject': 'Reset your password',
+        'intro': 'We received a request to reset your password. Click the button below to set a new password:',
+        'button': 'Reset Password',
+        'or_copy': 'Or copy and paste this link in your browser:',
+        'expires': 'This link will expire in {expire_hours} hour(s).',
+        'warning': "If you didn't request a password reset, please ignore this email or contact support if you're concerned.",
+        'regards': 'Best regards,',
+    },
+    'zh': {
+        'greeting': '您好{name}!',
+        'subject': '重置您的密码',
+        'intro': '我们收到了重置您密码的请求。点击下方按钮设置新密码：',
+        'button': '重置密码',
+        'or_copy': '或将此链接复制并粘贴到浏览器中：',
+        'expires': '此链接将在 {expire_hours} 小时后过期。',
+        'warning': '如果您没有请求重置密码，请忽略此邮件或联系客服。',
+        'regards': '此致,',
+    },
+    'ua': {
+        'greeting': 'Вітаємо{name}!',
+        'subject': 'Скидання пароля',
+        'intro': 'Ми отримали запит на скидання вашого пароля. Натисніть на кнопку нижче, щоб встановити новий пароль:',
+        'button': 'Скинути пароль',
+        'or_copy': 'Або скопіюйте та вставте це посилання в браузер:',
+        'expires': 'Посилання дійсне протягом {expire_hours} годин.',
+        'warning': "Якщо ви не запитували скидання пароля, проігноруйте цей лист або зв'яжіться з підтримкою.",
+        'regards': 'З повагою,',
+    },
+    'fa': {
+        'greeting': 'سلام{name}!',
+        'subject': 'بازنشانی رمز عبور',
+        'intro': 'درخواستی برای بازنشانی رمز عبور شما دریافت شد. برای تعیین رمز جدید روی دکمه زیر بزنید:',
+        'button': 'بازنشانی رمز عبور',
+        'or_copy': 'یا این لینک را در مرورگر خود کپی و باز کنید:',
+        'expires': 'این لینک تا {expire_hours} ساعت معتبر است.',
+        'warning': 'اگر شما درخواست بازنشانی رمز عبور نداده‌اید، این ایمیل را نادیده بگیرید یا با پشتیبانی تماس بگیرید.',
+        'regards': 'با احترام،',
+    },
+}
+
+_PASSWORD_RESET_HTML = string.Template(
+    """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .button {
+            display: inline-block;
+            padding: 12px 24px;
+            background-color: #dc3545;
+            color: white !important;
+            text-decoration: none;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+        .warning { color: #dc3545; font-weight: bold; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>$greeting</h2>
+        <p>$intro</p>
+        <a href="$full_url" class="button">$button</a>
+        <p>$or_copy</p>
+        <p><a href="$full_url">$full_url</a></p>
+        <p>$expires</p>
+        <p class="warning">$warning</p>
+        <div class="footer">
+            <p>$regards<br>$from_name</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+)
+
+
+_EMAIL_CHANGE_TEXTS = {
+    'ru': {
+        'greeting': 'Здравствуйте{name}!',
+        'subject': 'Код подтверждения для смены email',
+        'intro': 'Вы запросили смену email адреса. Используйте код ниже для подтверждения:',
+        'code_label': 'Ваш код подтверждения:',
+        'expires': 'Код действителен в течение {expire_minutes} минут.',
+        'ignore': 'Если вы не запрашивали смену email, просто проигнорируйте это письмо.',
+        'regards': 'С уважением,',
+    },
+    'en': {
+        'greeting': 'Hello{name}!',
+        'subject': 'Email change verification code',
+        'intro': 'You requested to change your email address. Use the code below to confirm:',
+        'code_label': 'Your verification code:',
+        'expires': 'This code will expire in {expire_minutes} minutes.',
+        'ignore': "If you didn't request an email change, you can safely ignore this email.",
+        'regards': 'Best regards,',
+    },
+    'zh': {
+        'greeting': '您好{name}!',
+        'subject': '邮箱更换验证码',
+        'intro': '您请求更换邮箱地址。请使用以下验证码确认：',
+        'code_label': '您的验证码：',
+        'expires': '此验证码将在 {expire_minutes} 分钟后过期。',
+        'ignore': '如果您没有请求更换邮箱，请忽略此邮件。',
+        'regards': '此致,',
+    },
+    'ua': {
+        'greeting': 'Вітаємо{name}!',
+        'subject': 'Код підтвердження для зміни email',
+        'intro': 'Ви запросили зміну email адреси. Використовуйте код нижче для підтвердження:',
+        'code_label': 'Ваш код підтвердження:',
+        'expires': 'Код дійсний протягом {expire_minutes} хвилин.',
+        'ignore': 'Якщо ви не запитували зміну email, просто проігноруйте цей лист.',
+        'regards': 'З повагою,',
+    },
+    'fa': {
+        'greeting': 'سلام{name}!',
+        'subject': 'کد تایید تغییر ایمیل',
+        'intro': 'شما درخواست تغییر ایمیل داده‌اید. برای تایید از کد زیر استفاده کنید:',
+        'code_label': 'کد تایید شما:',
+        'expires': 'این کد تا {expire_minutes} دقیقه معتبر است.',
+        'ignore': 'اگر شما درخواست تغییر ایمیل نداده‌اید، این ایمیل را نادیده بگیرید.',
+        'regards': 'با احترام،',
+    },
+}
+
+_EMAIL_CHANGE_HTML = string.Template(
+    """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .code-box {
+            background-color: #f8f9fa;
+            border: 2px solid #007bff;
+            border-radius: 8px;
+            padding: 20px;
+            text-align: center;
+            margin: 20px 0;
+        }
+        .code {
+            font-size: 32px;
+            font-weight: bold;
+            letter-spacing: 8px;
+            color: #007bff;
+            font-family: monospace;
+        }
+        .footer { margin-top: 30px; font-size: 12px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h2>$greeting</h2>
+        <p>$intro</p>
+        <div class="code-box">
+            <p>$code_label</p>
+            <p class="code">$code</p>
+        </div>
+        <p>$expires</p>
+        <p>$ignore</p>
+        <div class="footer">
+            <p>$regards<br>$from_name</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+)
+
+# Текстовые версии писем (multipart/alternative) - собираются из тех же текстов, без разбора HTML
+_VERIFICATION_PLAIN = string.Template(
+    '$greeting\n\n$intro\n$or_copy\n$full_url\n\n$expires\n\n$ignore\n\n$regards\n$from_name\n'
+)
+_PASSWORD_RESET_PLAIN = string.Template(
+    '$greeting\n\n$intro\n$or_copy\n$full_url\n\n$expires\n\n$warning\n\n$regards\n$from_name\n'
+)
+_EMAIL_CHANGE_PLAIN = string.Template(
+    '$greeting\n\n$intro\n\n$code_label $code\n\n$expires\n\n$ignore\n\n$regards\n$from_name\n'
+)
+
+# kind -> (тексты по языкам, HTML-шаблон, текстовый шаблон, имя плейсхолдера срока действия в тексте 'expires')
+_EMAIL_TEMPLATES = {
+    'verification': (_VERIFICATION_TEXTS, _VERIFICATION_HTML, _VERIFICATION_PLAIN, 'expire_hours'),
+    'password_reset': (_PASSWORD_RESET_TEXTS, _PASSWORD_RESET_HTML, _PASSWORD_RESET_PLAIN, 'expire_hours'),
+    'email_change': (_EMAIL_CHANGE_TEXTS, _EMAIL_CHANGE_HTML, _EMAIL_CHANGE_PLAIN, 'expire_minutes'),
+}
+
+
+@lru_cache(maxsize=64)
+def _render_email_template(
+    kind: str, language: str, expire: int, from_name: str
+) -> tuple[str, str, string.Template, string.Template]:
+    """Pre-render the static part of an email.
+
+    Returns (subject, greeting format string, HTML template, plain-text template).
+    The templates still contain only the per-recipient placeholders: $greeting
+    and $full_url or $code. Values for the HTML template must be HTML-escaped.
+    """
+    texts, html_template, plain_template, expire_key = _EMAIL_TEMPLATES[kind]
+    t = texts.get(language, texts['ru'])
+
+    static = {key: value.replace('$', '$$') for key, value in t.items() if key not in ('subject', 'greeting')}
+    static['expires'] = t['expires'].format(**{expire_key: expire}).replace('$', '$$')
+
+    static['from_name'] = html.escape(from_name).replace('$', '$$')
+    html_body = string.Template(html_template.safe_substitute(static))
+
+    static['from_name'] = from_name.replace('$', '$$')
+    plain_body = string.Template(plain_template.safe_substitute(static))
+
+    return t['subject'], t['greeting'], html_body, plain_body
 
 
 class EmailService:
@@ -23,6 +354,11 @@ class EmailService:
         self.from_email = settings.get_smtp_from_email()
         self.from_name = settings.SMTP_FROM_NAME
         self.use_tls = settings.SMTP_USE_TLS
+        # Ленивый прокси: контекст привязывается при первом вызове (уже после setup_logging), затем кешируется
+        self._log = structlog.get_logger(__name__, smtp_host=self.host)
+        # Пул авторизованных соединений: (smtp, время возврата в пул). Отправка идёт из потоков
+        self._pool: list[tuple[smtplib.SMTP, float]] = []
+        self._pool_lock = threading.Lock()
 
     def is_configured(self) -> bool:
         """Check if SMTP is properly configured."""
@@ -42,10 +378,66 @@ class EmailService:
             if smtp.has_extn('auth'):
                 smtp.login(self.user, self.password)
             else:
-                logger.debug('SMTP server does not support AUTH, skipping authentication', host=self.host)
+                self._log.debug('SMTP server does not support AUTH, skipping authentication')
 
         return smtp
 
+    @staticmethod
+    def _close_connection(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+    def _acquire_connection(self) -> smtplib.SMTP:
+        """Take a live connection from the pool or open a new one."""
+        idle_limit = settings.get_smtp_pool_idle_seconds()
+        while True:
+            with self._pool_lock:
+                if not self._pool:
+                    break
+                smtp, released_at = self._pool.pop()
+
+            if time.monotonic() - released_at < idle_limit:
+                try:
+                    if smtp.noop()[0] == 250:
+                        return smtp
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._close_connection(smtp)
+
+        return self._get_smtp_connection()
+
+    def _release_connection(self, smtp: smtplib.SMTP) -> None:
+        """Return a healthy connection to the pool, or close it if the pool is full."""
+        with self._pool_lock:
+            if len(self._pool) < settings.get_smtp_pool_size():
+                self._pool.append((smtp, time.monotonic()))
+                return
+        self._close_connection(smtp)
+
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body_html: str,
+        body_text: str | None = None,
+    ) -> EmailMessage:
+        """Build a multipart/alternative message with plain text and HTML parts."""
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = formataddr((self.from_name, self.from_email))
+        msg['To'] = to_email
+
+        # Plain text version
+        if body_text is None:
+            # Simple HTML to text conversion
+            body_text = html.unescape(_HTML_TAG_RE.sub('', body_html)).replace('\xa0', ' ')
+
+        msg.set_content(body_text)
+        msg.add_alternative(body_html, subtype='html')
+        return msg
+
     def send_email(
         self,
         to_email: str,
@@ -66,41 +458,75 @@ class EmailService:
             True if email was sent successfully, False otherwise
         """
         if not self.is_configured():
-            logger.warning('SMTP is not configured, cannot send email')
+            self._log.warning('SMTP is not configured, cannot send email')
             return False
 
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f'{self.from_name} <{self.from_email}>'
-            msg['To'] = to_email
+            msg = self._build_message(to_email, subject, body_html, body_text)
 
-            # Plain text version
-            if body_text is None:
-                # Simple HTML to text conversion
-                import re
+            smtp = self._acquire_connection()
+            try:
+                smtp.send_message(msg)
+            except Exception:
+                self._close_connection(smtp)
+                raise
+            self._release_connection(smtp)
 
-                body_text = re.sub(r'<[^>]+>', '', body_html)
-                body_text = body_text.replace('&nbsp;', ' ')
-                body_text = body_text.replace('&amp;', '&')
-                body_text = body_text.replace('&lt;', '<')
-                body_text = body_text.replace('&gt;', '>')
+            self._log.info('Email sent successfully to', to_email=to_email)
+            return True
 
-            part1 = MIMEText(body_text, 'plain', 'utf-8')
-            part2 = MIMEText(body_html, 'html', 'utf-8')
+        except Exception as e:
+            self._log.error('Failed to send email to', to_email=to_email, error=e)
+            return False
 
-            msg.attach(part1)
-            msg.attach(part2)
+    def send_bulk_email(self, messages: list[tuple[str, str, str]]) -> list[bool]:
+        """
+        Send several emails over a single SMTP connection.
 
-            with self._get_smtp_connection() as smtp:
-                smtp.sendmail(self.from_email, to_email, msg.as_string())
+        A rejected recipient only fails its own message; a broken connection
+        is replaced and the batch continues.
 
-            logger.info('Email sent successfully to', to_email=to_email)
-            return True
+        Args:
+            messages: (to_email, subject, body_html) tuples
 
-        except Exception as e:
-            logger.error('Failed to send email to', to_email=to_email, error=e)
-            return False
+        Returns:
+            Success flag for each message, in the same order
+        """
+        if not self.is_configured():
+            self._log.warning('SMTP is not configured, cannot send email')
+            return [False] * len(messages)
+
+        results: list[bool] = []
+        smtp: smtplib.SMTP | None = None
+
+        for to_email, subject, body_html in messages:
+            try:
+                msg = self._build_message(to_email, subject, body_html)
+                if smtp is None:
+                    smtp = self._acquire_connection()
+                smtp.send_message(msg)
+                results.append(True)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                # Обычно smtplib уже сделал RSET и соединение можно использовать дальше,
+                # но на 421 сервер закрывает сессию (smtp.sock is None) - тогда берём новое
+                if smtp is not None and smtp.sock is None:
+                    self._close_connection(smtp)
+                    smtp = None
+                self._log.warning('Failed to send email to', to_email=to_email, error=e)
+                results.append(False)
+            except Exception as e:
+                if smtp is not None:
+                    self._close_connection(smtp)
+                    smtp = None
+                self._log.warning('Failed to send email to', to_email=to_email, error=e)
+                results.append(False)
+
+        if smtp is not None:
+            self._release_connection(smtp)
+
+        sent = sum(results)
+        self._log.info('Bulk email batch sent', sent=sent, failed=len(results) - sent)
+        return results
 
     def send_verification_email(
         self,
@@ -133,101 +559,19 @@ class EmailService:
         full_url = f'{verification_url}?token={verification_token}'
         expire_hours = settings.get_cabinet_email_verification_expire_hours()
 
-        # Localized content
-        texts = {
-            'ru': {
-                'greeting': f'Здравствуйте{", " + username if username else ""}!',
-                'subject': 'Подтверждение email адреса',
-                'intro': 'Спасибо за регистрацию! Пожалуйста, подтвердите ваш email адрес, нажав на кнопку ниже:',
-                'button': 'Подтвердить email',
-                'or_copy': 'Или скопируйте и вставьте эту ссылку в браузер:',
-                'expires': f'Ссылка действительна в течение {expire_hours} часов.',
-                'ignore': 'Если вы не создавали аккаунт, просто проигнорируйте это письмо.',
-                'regards': 'С уважением,',
-            },
-            'en': {
-                'greeting': f'Hello{", " + username if username else ""}!',
-                'subject': 'Verify your email address',
-                'intro': 'Thank you for registering! Please verify your email address by clicking the button below:',
-                'button': 'Verify Email',
-                'or_copy': 'Or copy and paste this link in your browser:',
-                'expires': f'This link will expire in {expire_hours} hours.',
-                'ignore': "If you didn't create an account, you can safely ignore this email.",
-                'regards': 'Best regards,',
-            },
-            'zh': {
-                'greeting': f'您好{", " + username if username else ""}!',
-                'subject': '验证您的邮箱地址',
-                'intro': '感谢您的注册！请点击下方按钮验证您的邮箱地址：',
-                'button': '验证邮箱',
-                'or_copy': '或将此链接复制并粘贴到浏览器中：',
-                'expires': f'此链接将在 {expire_hours} 小时后过期。',
-                'ignore': '如果您没有创建账户，请忽略此邮件。',
-                'regards': '此致,',
-            },
-            'ua': {
-                'greeting': f'Вітаємо{", " + username if username else ""}!',
-                'subject': 'Підтвердження email адреси',
-                'intro': 'Дякуємо за реєстрацію! Будь ласка, підтвердіть вашу email адресу, натиснувши на кнопку нижче:',
-                'button': 'Підтвердити email',
-                'or_copy': 'Або скопіюйте та вставте це посилання в браузер:',
-                'expires': f'Посилання дійсне протягом {expire_hours} годин.',
-                'ignore': 'Якщо ви не створювали акаунт, просто проігноруйте цей лист.',
-                'regards': 'З повагою,',
-            },
-            'fa': {
-                'greeting': f'سلام{", " + username if username else ""}!',
-                'subject': 'تایید آدرس ایمیل',
-                'intro': 'از ثبت‌نام شما سپاسگزاریم! لطفاً با کلیک روی دکمه زیر ایمیل خود را تایید کنید:',
-                'button': 'تایید ایمیل',
-                'or_copy': 'یا این لینک را در مرورگر خود کپی و باز کنید:',
-                'expires': f'این لینک تا {expire_hours} ساعت معتبر است.',
-                'ignore': 'اگر شما این حساب را ایجاد نکرده‌اید، این ایمیل را نادیده بگیرید.',
-                'regards': 'با احترام،',
-            },
-        }
-
-        t = texts.get(language, texts['ru'])
-
-        subject = t['subject']
-        body_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .button {{
-                    display: inline-block;
-                    padding: 12px 24px;
-                    background-color: #007bff;
-                    color: white !important;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .footer {{ margin-top: 30px; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>{t['greeting']}</h2>
-                <p>{t['intro']}</p>
-                <a href="{full_url}" class="button">{t['button']}</a>
-                <p>{t['or_copy']}</p>
-                <p><a href="{full_url}">{full_url}</a></p>
-                <p>{t['expires']}</p>
-                <p>{t['ignore']}</p>
-                <div class="footer">
-                    <p>{t['regards']}<br>{self.from_name}</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        subject, greeting, html_template, plain_template = _render_email_template(
+            'verification', language, expire_hours, self.from_name
+        )
+        body_html = html_template.substitute(
+            greeting=greeting.format(name=f', {html.escape(username)}' if username else ''),
+            full_url=html.escape(full_url),
+        )
+        body_text = plain_template.substitute(
+            greeting=greeting.format(name=f', {username}' if username else ''),
+            full_url=full_url,
+        )
 
-        return self.send_email(to_email, subject, body_html)
+        return self.send_email(to_email, subject, body_html, body_text)
 
     def send_password_reset_email(
         self,
@@ -260,102 +604,19 @@ class EmailService:
         full_url = f'{reset_url}?token={reset_token}'
         expire_hours = settings.get_cabinet_password_reset_expire_hours()
 
-        # Localized content
-        texts = {
-            'ru': {
-                'greeting': f'Здравствуйте{", " + username if username else ""}!',
-                'subject': 'Сброс пароля',
-                'intro': 'Мы получили запрос на сброс вашего пароля. Нажмите на кнопку ниже, чтобы установить новый пароль:',
-                'button': 'Сбросить пароль',
-                'or_copy': 'Или скопируйте и вставьте эту ссылку в браузер:',
-                'expires': f'Ссылка действительна в течение {expire_hours} часов.',
-                'warning': 'Если вы не запрашивали сброс пароля, проигнорируйте это письмо или свяжитесь с поддержкой.',
-                'regards': 'С уважением,',
-            },
-            'en': {
-                'greeting': f'Hello{", " + username if username else ""}!',
-                'subject': 'Reset your password',
-                'intro': 'We received a request to reset your password. Click the button below to set a new password:',
-                'button': 'Reset Password',
-                'or_copy': 'Or copy and paste this link in your browser:',
-                'expires': f'This link will expire in {expire_hours} hour(s).',
-                'warning': "If you didn't request a password reset, please ignore this email or contact support if you're concerned.",
-                'regards': 'Best regards,',
-            },
-            'zh': {
-                'greeting': f'您好{", " + username if username else ""}!',
-                'subject': '重置您的密码',
-                'intro': '我们收到了重置您密码的请求。点击下方按钮设置新密码：',
-                'button': '重置密码',
-                'or_copy': '或将此链接复制并粘贴到浏览器中：',
-                'expires': f'此链接将在 {expire_hours} 小时后过期。',
-                'warning': '如果您没有请求重置密码，请忽略此邮件或联系客服。',
-                'regards': '此致,',
-            },
-            'ua': {
-                'greeting': f'Вітаємо{", " + username if username else ""}!',
-                'subject': 'Скидання пароля',
-                'intro': 'Ми отримали запит на скидання вашого пароля. Натисніть на кнопку нижче, щоб встановити новий пароль:',
-                'button': 'Скинути пароль',
-                'or_copy': 'Або скопіюйте та вставте це посилання в браузер:',
-                'expires': f'Посилання дійсне протягом {expire_hours} годин.',
-                'warning': "Якщо ви не запитували скидання пароля, проігноруйте цей лист або зв'яжіться з підтримкою.",
-                'regards': 'З повагою,',
-            },
-            'fa': {
-                'greeting': f'سلام{", " + username if username else ""}!',
-                'subject': 'بازنشانی رمز عبور',
-                'intro': 'درخواستی برای بازنشانی رمز عبور شما دریافت شد. برای تعیین رمز جدید روی دکمه زیر بزنید:',
-                'button': 'بازنشانی رمز عبور',
-                'or_copy': 'یا این لینک را در مرورگر خود کپی و باز کنید:',
-                'expires': f'این لینک تا {expire_hours} ساعت معتبر است.',
-                'warning': 'اگر شما درخواست بازنشانی رمز عبور نداده‌اید، این ایمیل را نادیده بگیرید یا با پشتیبانی تماس بگیرید.',
-                'regards': 'با احترام،',
-            },
-        }
-
-        t = texts.get(language, texts['ru'])
-
-        subject = t['subject']
-        body_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .button {{
-                    display: inline-block;
-                    padding: 12px 24px;
-                    background-color: #dc3545;
-                    color: white !important;
-                    text-decoration: none;
-                    border-radius: 5px;
-                    margin: 20px 0;
-                }}
-                .footer {{ margin-top: 30px; font-size: 12px; color: #666; }}
-                .warning {{ color: #dc3545; font-weight: bold; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>{t['greeting']}</h2>
-                <p>{t['intro']}</p>
-                <a href="{full_url}" class="button">{t['button']}</a>
-                <p>{t['or_copy']}</p>
-                <p><a href="{full_url}">{full_url}</a></p>
-                <p>{t['expires']}</p>
-                <p class="warning">{t['warning']}</p>
-                <div class="footer">
-                    <p>{t['regards']}<br>{self.from_name}</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        subject, greeting, html_template, plain_template = _render_email_template(
+            'password_reset', language, expire_hours, self.from_name
+        )
+        body_html = html_template.substitute(
+            greeting=greeting.format(name=f', {html.escape(username)}' if username else ''),
+            full_url=html.escape(full_url),
+        )
+        body_text = plain_template.substitute(
+            greeting=greeting.format(name=f', {username}' if username else ''),
+            full_url=full_url,
+        )
 
-        return self.send_email(to_email, subject, body_html)
+        return self.send_email(to_email, subject, body_html, body_text)
 
     def send_email_change_code(
         self,
@@ -385,102 +646,19 @@ class EmailService:
 
         expire_minutes = settings.get_cabinet_email_change_code_expire_minutes()
 
-        texts = {
-            'ru': {
-                'greeting': f'Здравствуйте{", " + username if username else ""}!',
-                'subject': 'Код подтверждения для смены email',
-                'intro': 'Вы запросили смену email адреса. Используйте код ниже для подтверждения:',
-                'code_label': 'Ваш код подтверждения:',
-                'expires': f'Код действителен в течение {expire_minutes} минут.',
-                'ignore': 'Если вы не запрашивали смену email, просто проигнорируйте это письмо.',
-                'regards': 'С уважением,',
-            },
-            'en': {
-                'greeting': f'Hello{", " + username if username else ""}!',
-                'subject': 'Email change verification code',
-                'intro': 'You requested to change your email address. Use the code below to confirm:',
-                'code_label': 'Your verification code:',
-                'expires': f'This code will expire in {expire_minutes} minutes.',
-                'ignore': "If you didn't request an email change, you can safely ignore this email.",
-                'regards': 'Best regards,',
-            },
-            'zh': {
-                'greeting': f'您好{", " + username if username else ""}!',
-                'subject': '邮箱更换验证码',
-                'intro': '您请求更换邮箱地址。请使用以下验证码确认：',
-                'code_label': '您的验证码：',
-                'expires': f'此验证码将在 {expire_minutes} 分钟后过期。',
-                'ignore': '如果您没有请求更换邮箱，请忽略此邮件。',
-                'regards': '此致,',
-            },
-            'ua': {
-                'greeting': f'Вітаємо{", " + username if username else ""}!',
-                'subject': 'Код підтвердження для зміни email',
-                'intro': 'Ви запросили зміну email адреси. Використовуйте код нижче для підтвердження:',
-                'code_label': 'Ваш код підтвердження:',
-                'expires': f'Код дійсний протягом {expire_minutes} хвилин.',
-                'ignore': 'Якщо ви не запитували зміну email, просто проігноруйте цей лист.',
-                'regards': 'З повагою,',
-            },
-            'fa': {
-                'greeting': f'سلام{", " + username if username else ""}!',
-                'subject': 'کد تایید تغییر ایمیل',
-                'intro': 'شما درخواست تغییر ایمیل داده‌اید. برای تایید از کد زیر استفاده کنید:',
-                'code_label': 'کد تایید شما:',
-                'expires': f'این کد تا {expire_minutes} دقیقه معتبر است.',
-                'ignore': 'اگر شما درخواست تغییر ایمیل نداده‌اید، این ایمیل را نادیده بگیرید.',
-                'regards': 'با احترام،',
-            },
-        }
-
-        t = texts.get(language, texts['ru'])
-
-        subject = t['subject']
-        body_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .code-box {{
-                    background-color: #f8f9fa;
-                    border: 2px solid #007bff;
-                    border-radius: 8px;
-                    padding: 20px;
-                    text-align: center;
-                    margin: 20px 0;
-                }}
-                .code {{
-                    font-size: 32px;
-                    font-weight: bold;
-                    letter-spacing: 8px;
-                    color: #007bff;
-                    font-family: monospace;
-                }}
-                .footer {{ margin-top: 30px; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h2>{t['greeting']}</h2>
-                <p>{t['intro']}</p>
-                <div class="code-box">
-                    <p>{t['code_label']}</p>
-                    <p class="code">{code}</p>
-                </div>
-                <p>{t['expires']}</p>
-                <p>{t['ignore']}</p>
-                <div class="footer">
-                    <p>{t['regards']}<br>{self.from_name}</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return self.send_email(to_email, subject, body_html)
+        subject, greeting, html_template, plain_template = _render_email_template(
+            'email_change', language, expire_minutes, self.from_name
+        )
+        body_html = html_template.substitute(
+            greeting=greeting.format(name=f', {html.escape(username)}' if username else ''),
+            code=code,
+        )
+        body_text = plain_template.substitute(
+            greeting=greeting.format(name=f', {username}' if username else ''),
+            code=code,
+        )
+
+        return self.send_email(to_email, subject, body_html, body_text)
 
 
 # Singleton instance
@@ -10,6 +10,23 @@ from typing import Any
 from app.config import settings
 
 
+_FOOTER_TEXTS = {
+    'ru': 'Это автоматическое сообщение. Пожалуйста, не отвечайте на это письмо.',
+    'en': 'This is an automated message. Please do not reply to this email.',
+    'zh': '这是一封自动发送的邮件，请勿回复。',
+    'ua': 'Це автоматичне повідомлення. Будь ласка, не відповідайте на цей лист.',
+    'fa': 'این یک پیام خودکار است. لطفاً به این ایمیل پاسخ ندهید.',
+}
+
+_CABINET_BUTTON_TEXTS = {
+    'ru': 'Открыть личный кабинет',
+    'en': 'Open Dashboard',
+    'zh': '打开控制面板',
+    'ua': 'Відкрити особистий кабінет',
+    'fa': 'باز کردن پنل کاربری',
+}
+
+
 class EmailNotificationTemplates:
     """HTML email templates for user notifications."""
 
@@ -72,14 +89,7 @@ class EmailNotificationTemplates:
 
     def _get_base_template(self, content: str, language: str = 'ru') -> str:
         """Wrap content in base HTML template."""
-        footer_texts = {
-            'ru': 'Это автоматическое сообщение. Пожалуйста, не отвечайте на это письмо.',
-            'en': 'This is an automated message. Please do not reply to this email.',
-            'zh': '这是一封自动发送的邮件，请勿回复。',
-            'ua': 'Це автоматичне повідомлення. Будь ласка, не відповідайте на цей лист.',
-            'fa': 'این یک پیام خودکار است. لطفاً به این ایمیل پاسخ ندهید.',
-        }
-        footer_text = footer_texts.get(language, footer_texts['ru'])
+        footer_text = _FOOTER_TEXTS.get(language, _FOOTER_TEXTS['ru'])
 
         return f"""
 <!DOCTYPE html>
@@ -183,14 +193,7 @@ class EmailNotificationTemplates:
         if not self.cabinet_url:
             return ''
 
-        texts = {
-            'ru': 'Открыть личный кабинет',
-            'en': 'Open Dashboard',
-            'zh': '打开控制面板',
-            'ua': 'Відкрити особистий кабінет',
-            'fa': 'باز کردن پنل کاربری',
-        }
-        text = texts.get(language, texts['en'])
+        text = _CABINET_BUTTON_TEXTS.get(language, _CABINET_BUTTON_TEXTS['en'])
 
         return f'<p style="text-align: center;"><a href="{self.cabinet_url}" class="button">{text}</a></p>'
 
@@ -210,6 +213,8 @@ class EmailNotificationTemplates:
             'ua': f'Баланс поповнено на {amount}',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Баланс успешно пополнен!</h2>
@@ -218,7 +223,7 @@ class EmailNotificationTemplates:
                     <p>Текущий баланс: <strong>{balance}</strong></p>
                 </div>
                 <p>Спасибо за использование нашего сервиса!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Balance Successfully Topped Up!</h2>
@@ -227,7 +232,7 @@ class EmailNotificationTemplates:
                     <p>Current balance: <strong>{balance}</strong></p>
                 </div>
                 <p>Thank you for using our service!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>充值成功！</h2>
@@ -236,7 +241,7 @@ class EmailNotificationTemplates:
                     <p>当前余额: <strong>{balance}</strong></p>
                 </div>
                 <p>感谢使用我们的服务！</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Баланс успішно поповнено!</h2>
@@ -245,7 +250,7 @@ class EmailNotificationTemplates:
                     <p>Поточний баланс: <strong>{balance}</strong></p>
                 </div>
                 <p>Дякуємо за використання нашого сервісу!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -266,6 +271,8 @@ class EmailNotificationTemplates:
             'ua': 'Зміна балансу',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Изменение баланса</h2>
@@ -273,7 +280,7 @@ class EmailNotificationTemplates:
                     <p>Сумма: <strong>{amount}</strong></p>
                     <p>Текущий баланс: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Balance Changed</h2>
@@ -281,7 +288,7 @@ class EmailNotificationTemplates:
                     <p>Amount: <strong>{amount}</strong></p>
                     <p>Current balance: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>余额变动</h2>
@@ -289,7 +296,7 @@ class EmailNotificationTemplates:
                     <p>金额: <strong>{amount}</strong></p>
                     <p>当前余额: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Зміна балансу</h2>
@@ -297,7 +304,7 @@ class EmailNotificationTemplates:
                     <p>Сума: <strong>{amount}</strong></p>
                     <p>Поточний баланс: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -322,6 +329,8 @@ class EmailNotificationTemplates:
             'ua': f'Підписка закінчується через {days_left} дн.',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Подписка скоро истекает</h2>
@@ -330,7 +339,7 @@ class EmailNotificationTemplates:
                     <p>Дата истечения: <strong>{expires_at}</strong></p>
                 </div>
                 <p>Продлите подписку, чтобы не потерять доступ к сервису.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Subscription Expiring Soon</h2>
@@ -339,7 +348,7 @@ class EmailNotificationTemplates:
                     <p>Expiration date: <strong>{expires_at}</strong></p>
                 </div>
                 <p>Renew your subscription to maintain access to our service.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>订阅即将到期</h2>
@@ -348,7 +357,7 @@ class EmailNotificationTemplates:
                     <p>到期日期: <strong>{expires_at}</strong></p>
                 </div>
                 <p>请续订以保持对服务的访问。</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Підписка скоро закінчується</h2>
@@ -357,7 +366,7 @@ class EmailNotificationTemplates:
                     <p>Дата закінчення: <strong>{expires_at}</strong></p>
                 </div>
                 <p>Продовжіть підписку, щоб не втратити доступ до сервісу.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -375,6 +384,8 @@ class EmailNotificationTemplates:
             'ua': 'Підписка закінчилась',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Подписка истекла</h2>
@@ -382,7 +393,7 @@ class EmailNotificationTemplates:
                     <p>Ваша подписка истекла. Доступ к VPN отключён.</p>
                 </div>
                 <p>Оформите новую подписку, чтобы продолжить использование сервиса.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Subscription Expired</h2>
@@ -390,7 +401,7 @@ class EmailNotificationTemplates:
                     <p>Your subscription has expired. VPN access has been disabled.</p>
                 </div>
                 <p>Purchase a new subscription to continue using our service.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>订阅已到期</h2>
@@ -398,7 +409,7 @@ class EmailNotificationTemplates:
                     <p>您的订阅已到期。VPN访问已被禁用。</p>
                 </div>
                 <p>请购买新订阅以继续使用我们的服务。</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Підписка закінчилась</h2>
@@ -406,7 +417,7 @@ class EmailNotificationTemplates:
                     <p>Ваша підписка закінчилась. Доступ до VPN вимкнено.</p>
                 </div>
                 <p>Оформіть нову підписку, щоб продовжити використання сервісу.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -426,6 +437,8 @@ class EmailNotificationTemplates:
             'ua': 'Підписку продовжено',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Подписка успешно продлена!</h2>
@@ -434,7 +447,7 @@ class EmailNotificationTemplates:
                     <p>Новая дата истечения: <strong>{new_expires_at}</strong></p>
                 </div>
                 <p>Спасибо за использование нашего сервиса!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Subscription Successfully Renewed!</h2>
@@ -443,7 +456,7 @@ class EmailNotificationTemplates:
                     <p>New expiration date: <strong>{new_expires_at}</strong></p>
                 </div>
                 <p>Thank you for using our service!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -463,6 +476,8 @@ class EmailNotificationTemplates:
             'ua': 'Підписку активовано',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Подписка активирована!</h2>
@@ -471,7 +486,7 @@ class EmailNotificationTemplates:
                     <p>Действует до: <strong>{expires_at}</strong></p>
                 </div>
                 <p>Теперь вы можете пользоваться VPN сервисом.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Subscription Activated!</h2>
@@ -480,7 +495,7 @@ class EmailNotificationTemplates:
                     <p>Valid until: <strong>{expires_at}</strong></p>
                 </div>
                 <p>You can now use the VPN service.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -505,6 +520,8 @@ class EmailNotificationTemplates:
             'ua': 'Автопродовження виконано',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Автопродление выполнено</h2>
@@ -513,7 +530,7 @@ class EmailNotificationTemplates:
                     <p>Списано с баланса: <strong>{amount}</strong></p>
                     <p>Новая дата истечения: <strong>{new_expires_at}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Auto-renewal Successful</h2>
@@ -522,7 +539,7 @@ class EmailNotificationTemplates:
                     <p>Charged from balance: <strong>{amount}</strong></p>
                     <p>New expiration date: <strong>{new_expires_at}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -542,6 +559,8 @@ class EmailNotificationTemplates:
             'ua': 'Помилка автопродовження',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Ошибка автопродления</h2>
@@ -550,7 +569,7 @@ class EmailNotificationTemplates:
                     {f'<p>Причина: {reason}</p>' if reason else ''}
                 </div>
                 <p>Пожалуйста, пополните баланс и продлите подписку вручную.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Auto-renewal Failed</h2>
@@ -559,7 +578,7 @@ class EmailNotificationTemplates:
                     {f'<p>Reason: {reason}</p>' if reason else ''}
                 </div>
                 <p>Please top up your balance and renew manually.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -580,6 +599,8 @@ class EmailNotificationTemplates:
             'ua': 'Недостатньо коштів для автопродовження',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Недостаточно средств</h2>
@@ -589,7 +610,7 @@ class EmailNotificationTemplates:
                     {f'<p>На балансе: <strong>{balance}</strong></p>' if balance else ''}
                 </div>
                 <p>Пополните баланс, чтобы подписка была продлена автоматически.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Insufficient Funds</h2>
@@ -599,7 +620,7 @@ class EmailNotificationTemplates:
                     {f'<p>Balance: <strong>{balance}</strong></p>' if balance else ''}
                 </div>
                 <p>Top up your balance for automatic renewal.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -624,6 +645,8 @@ class EmailNotificationTemplates:
             'ua': f'Списання за підписку: {amount}',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Ежедневное списание</h2>
@@ -631,7 +654,7 @@ class EmailNotificationTemplates:
                     <p>С вашего баланса списано: <strong>{amount}</strong></p>
                     <p>Остаток на балансе: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Daily Charge</h2>
@@ -639,7 +662,7 @@ class EmailNotificationTemplates:
                     <p>Charged from your balance: <strong>{amount}</strong></p>
                     <p>Remaining balance: <strong>{balance}</strong></p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -657,6 +680,8 @@ class EmailNotificationTemplates:
             'ua': 'Недостатньо коштів',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Недостаточно средств</h2>
@@ -665,7 +690,7 @@ class EmailNotificationTemplates:
                     <p>Подписка будет приостановлена.</p>
                 </div>
                 <p>Пополните баланс, чтобы продолжить использование сервиса.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Insufficient Funds</h2>
@@ -674,7 +699,7 @@ class EmailNotificationTemplates:
                     <p>Your subscription will be suspended.</p>
                 </div>
                 <p>Please top up your balance to continue using the service.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -692,20 +717,22 @@ class EmailNotificationTemplates:
             'ua': 'Трафік оновлено',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Трафик обновлён</h2>
                 <div class="highlight success">
                     <p>Ваш трафик был сброшен. Вы можете продолжить использование VPN.</p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Traffic Reset</h2>
                 <div class="highlight success">
                     <p>Your traffic has been reset. You can continue using the VPN.</p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -762,6 +789,8 @@ class EmailNotificationTemplates:
             'ua': 'Обліковий запис розблоковано',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Аккаунт разблокирован</h2>
@@ -769,7 +798,7 @@ class EmailNotificationTemplates:
                     <p>Ваш аккаунт был разблокирован.</p>
                     <p>Вы снова можете пользоваться сервисом.</p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Account Reactivated</h2>
@@ -777,7 +806,7 @@ class EmailNotificationTemplates:
                     <p>Your account has been reactivated.</p>
                     <p>You can use the service again.</p>
                 </div>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -833,6 +862,8 @@ class EmailNotificationTemplates:
             'ua': f'Реферальний бонус: +{bonus}',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Реферальный бонус!</h2>
@@ -841,7 +872,7 @@ class EmailNotificationTemplates:
                     {f'<p>Благодаря пользователю: {referral_name}</p>' if referral_name else ''}
                 </div>
                 <p>Продолжайте приглашать друзей и зарабатывайте больше!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Referral Bonus!</h2>
@@ -850,7 +881,7 @@ class EmailNotificationTemplates:
                     {f'<p>Thanks to: {referral_name}</p>' if referral_name else ''}
                 </div>
                 <p>Keep inviting friends and earn more!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -870,6 +901,8 @@ class EmailNotificationTemplates:
             'ua': 'Новий реферал зареєстрований',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Новый реферал!</h2>
@@ -877,7 +910,7 @@ class EmailNotificationTemplates:
                     <p>По вашей ссылке зарегистрировался новый пользователь{f': <strong>{referral_name}</strong>' if referral_name else ''}.</p>
                 </div>
                 <p>Вы будете получать бонусы с его пополнений!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>New Referral!</h2>
@@ -885,7 +918,7 @@ class EmailNotificationTemplates:
                     <p>A new user registered using your link{f': <strong>{referral_name}</strong>' if referral_name else ''}.</p>
                 </div>
                 <p>You will receive bonuses from their top-ups!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -910,6 +943,8 @@ class EmailNotificationTemplates:
             'ua': 'Заявка на партнерство схвалена',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Заявка на партнёрство одобрена!</h2>
@@ -919,7 +954,7 @@ class EmailNotificationTemplates:
                     {f'<p>Комментарий: {comment}</p>' if comment else ''}
                 </div>
                 <p>Теперь вы можете приглашать пользователей и получать вознаграждение!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Partner Application Approved!</h2>
@@ -929,7 +964,7 @@ class EmailNotificationTemplates:
                     {f'<p>Comment: {comment}</p>' if comment else ''}
                 </div>
                 <p>You can now invite users and earn rewards!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>合作伙伴申请已批准！</h2>
@@ -939,7 +974,7 @@ class EmailNotificationTemplates:
                     {f'<p>备注: {comment}</p>' if comment else ''}
                 </div>
                 <p>您现在可以邀请用户并获得奖励！</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Заявка на партнерство схвалена!</h2>
@@ -949,7 +984,7 @@ class EmailNotificationTemplates:
                     {f'<p>Коментар: {comment}</p>' if comment else ''}
                 </div>
                 <p>Тепер ви можете запрошувати користувачів та отримувати винагороду!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -969,6 +1004,8 @@ class EmailNotificationTemplates:
             'ua': 'Заявка на партнерство відхилена',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Заявка на партнёрство отклонена</h2>
@@ -977,7 +1014,7 @@ class EmailNotificationTemplates:
                     {f'<p>Причина: {comment}</p>' if comment else ''}
                 </div>
                 <p>Вы можете подать новую заявку позже.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Partner Application Rejected</h2>
@@ -986,7 +1023,7 @@ class EmailNotificationTemplates:
                     {f'<p>Reason: {comment}</p>' if comment else ''}
                 </div>
                 <p>You can submit a new application later.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>合作伙伴申请被拒绝</h2>
@@ -995,7 +1032,7 @@ class EmailNotificationTemplates:
                     {f'<p>原因: {comment}</p>' if comment else ''}
                 </div>
                 <p>您可以稍后提交新的申请。</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Заявка на партнерство відхилена</h2>
@@ -1004,7 +1041,7 @@ class EmailNotificationTemplates:
                     {f'<p>Причина: {comment}</p>' if comment else ''}
                 </div>
                 <p>Ви можете подати нову заявку пізніше.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -1029,6 +1066,8 @@ class EmailNotificationTemplates:
             'ua': f'Запит на виведення {amount} схвалено',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Запрос на вывод одобрен!</h2>
@@ -1038,7 +1077,7 @@ class EmailNotificationTemplates:
                     {f'<p>Комментарий: {comment}</p>' if comment else ''}
                 </div>
                 <p>Средства будут переведены в ближайшее время.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Withdrawal Request Approved!</h2>
@@ -1048,7 +1087,7 @@ class EmailNotificationTemplates:
                     {f'<p>Comment: {comment}</p>' if comment else ''}
                 </div>
                 <p>Funds will be transferred shortly.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>提现请求已批准！</h2>
@@ -1058,7 +1097,7 @@ class EmailNotificationTemplates:
                     {f'<p>备注: {comment}</p>' if comment else ''}
                 </div>
                 <p>资金将很快转入。</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Запит на виведення схвалено!</h2>
@@ -1068,7 +1107,7 @@ class EmailNotificationTemplates:
                     {f'<p>Коментар: {comment}</p>' if comment else ''}
                 </div>
                 <p>Кошти будуть переведені найближчим часом.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -1089,6 +1128,8 @@ class EmailNotificationTemplates:
             'ua': f'Запит на виведення {amount} відхилено',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Запрос на вывод отклонён</h2>
@@ -1098,7 +1139,7 @@ class EmailNotificationTemplates:
                     {f'<p>Причина: {comment}</p>' if comment else ''}
                 </div>
                 <p>Средства возвращены на ваш баланс.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Withdrawal Request Rejected</h2>
@@ -1108,7 +1149,7 @@ class EmailNotificationTemplates:
                     {f'<p>Reason: {comment}</p>' if comment else ''}
                 </div>
                 <p>Funds have been returned to your balance.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'zh': f"""
                 <h2>提现请求被拒绝</h2>
@@ -1118,7 +1159,7 @@ class EmailNotificationTemplates:
                     {f'<p>原因: {comment}</p>' if comment else ''}
                 </div>
                 <p>资金已退回您的余额。</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'ua': f"""
                 <h2>Запит на виведення відхилено</h2>
@@ -1128,7 +1169,7 @@ class EmailNotificationTemplates:
                     {f'<p>Причина: {comment}</p>' if comment else ''}
                 </div>
                 <p>Кошти повернуто на ваш баланс.</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
@@ -1153,6 +1194,8 @@ class EmailNotificationTemplates:
             'ua': f'Платіж отримано: {amount}',
         }
 
+        cabinet_button = self._get_cabinet_button(language)
+
         bodies = {
             'ru': f"""
                 <h2>Платёж успешно обработан</h2>
@@ -1161,7 +1204,7 @@ class EmailNotificationTemplates:
                     {f'<p>Способ оплаты: {payment_method}</p>' if payment_method else ''}
                 </div>
                 <p>Спасибо за оплату!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
             'en': f"""
                 <h2>Payment Successfully Processed</h2>
@@ -1170,7 +1213,7 @@ class EmailNotificationTemplates:
                     {f'<p>Payment method: {payment_method}</p>' if payment_method else ''}
                 </div>
                 <p>Thank you for your payment!</p>
-                {self._get_cabinet_button(language)}
+                {cabinet_button}
             """,
         }
 
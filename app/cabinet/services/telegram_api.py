@@ -0,0 +1,24 @@
+"""Pooled HTTP client for direct Telegram Bot API calls from the cabinet."""
+
+import httpx
+
+
+# Shared client: keeps the TLS connection to api.telegram.org alive between requests
+_telegram_client: httpx.AsyncClient | None = None
+
+
+def get_telegram_client() -> httpx.AsyncClient:
+    """Get or lazily create the pooled Telegram Bot API client."""
+    global _telegram_client
+    if _telegram_client is None or _telegram_client.is_closed:
+        # httpx default timeout (5s) and pool limits, same as the former per-request clients
+        _telegram_client = httpx.AsyncClient(http2=True)
+    return _telegram_client
+
+
+async def close_telegram_client() -> None:
+    """Close the pooled Telegram Bot API client. Called on application shutdown."""
+    global _telegram_client
+    if _telegram_client is not None:
+        await _telegram_client.aclose()
+        _telegram_client = None
@@ -736,6 +736,7 @@ class Settings(BaseSettings):
     CABINET_EMAIL_CHANGE_CODE_EXPIRE_MINUTES: int = 15  # Email change verification code expiration
     CABINET_EMAIL_AUTH_ENABLED: bool = True  # Enable email registration/login in cabinet
     CABINET_URL: str = 'https://example.com/cabinet'  # Base URL for cabinet (used in verification emails)
+    CABINET_WS_SEND_QUEUE_SIZE: int = 64  # Max pending outbound WS messages per connection before it is dropped as slow
 
     # OAuth 2.0 provider settings for cabinet
     OAUTH_GOOGLE_CLIENT_ID: str = ''
@@ -754,6 +755,8 @@ class Settings(BaseSettings):
     OAUTH_VK_CLIENT_SECRET: str = ''
     OAUTH_VK_ENABLED: bool = False
 
+    OAUTH_MAX_CONCURRENT_REQUESTS: int = 32  # Per-provider limit for outbound OAuth API calls
+
     # SMTP settings for cabinet email
     SMTP_HOST: str | None = None
     SMTP_PORT: int = 587
@@ -762,6 +765,8 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str | None = None
     SMTP_FROM_NAME: str = 'VPN Service'
     SMTP_USE_TLS: bool = True
+    SMTP_POOL_SIZE: int = 4  # Max idle SMTP connections kept open for reuse (0 = reconnect per email)
+    SMTP_POOL_IDLE_SECONDS: int = 60  # Idle pooled SMTP connection older than this is closed instead of reused
 
     # Ban System Integration (BedolagaBan monitoring)
     BAN_SYSTEM_ENABLED: bool = False
@@ -2517,6 +2522,9 @@ class Settings(BaseSettings):
     def is_cabinet_email_auth_enabled(self) -> bool:
         return bool(self.CABINET_EMAIL_AUTH_ENABLED)
 
+    def get_cabinet_ws_send_queue_size(self) -> int:
+        return max(1, self.CABINET_WS_SEND_QUEUE_SIZE)
+
     def is_smtp_configured(self) -> bool:
         # For servers without AUTH, only host and from_email are required
         has_from = bool(self.SMTP_FROM_EMAIL or self.SMTP_USER)
@@ -2527,6 +2535,12 @@ class Settings(BaseSettings):
             return self.SMTP_FROM_EMAIL
         return self.SMTP_USER
 
+    def get_smtp_pool_size(self) -> int:
+        return max(0, self.SMTP_POOL_SIZE)
+
+    def get_smtp_pool_idle_seconds(self) -> int:
+        return max(1, self.SMTP_POOL_IDLE_SECONDS)
+
     # OAuth helpers
     def get_oauth_providers_config(self) -> dict[str, dict[str, str | bool]]:
         """Return config for all OAuth providers (enabled or not)."""
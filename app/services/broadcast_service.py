@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import math
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -804,40 +805,28 @@ class EmailBroadcastService:
         """
         Отправляет email-рассылку с rate limiting.
 
-        Использует run_in_executor для синхронного SMTP, ограничивая
-        параллельность семафором EMAIL_RATE_LIMIT.
+        Батч делится на EMAIL_RATE_LIMIT частей; каждая часть уходит одним
+        вызовом send_bulk_email через asyncio.to_thread по одному SMTP-соединению.
         """
         sent_count = 0
         failed_count = 0
         last_progress_count = 0
         last_progress_time: float = 0.0
 
-        semaphore = asyncio.Semaphore(EMAIL_RATE_LIMIT)
-
-        async def send_single_email(recipient: _EmailRecipient) -> bool | None:
-            """Отправляет один email."""
-            async with semaphore:
-                if cancel_event.is_set():
-                    return None
-
-                html_content = self._render_template(config.email_html_content, recipient)
-                subject = self._render_template(config.email_subject, recipient)
+        async def send_chunk(chunk: list[_EmailRecipient]) -> list[bool] | None:
+            """Отправляет часть батча по одному SMTP-соединению."""
+            if cancel_event.is_set():
+                return None
 
-                try:
-                    loop = asyncio.get_event_loop()
-                    success = await loop.run_in_executor(
-                        None,
-                        self._email_service.send_email,
-                        recipient.email,
-                        subject,
-                        html_content,
-                    )
-                    return success
-                except Exception as exc:
-                    logger.error(
-                        'Ошибка отправки email рассылки на', broadcast_id=broadcast_id, email=recipient.email, exc=exc
-                    )
-                    return False
+            messages = [
+                (
+                    recipient.email,
+                    self._render_template(config.email_subject, recipient),
+                    self._render_template(config.email_html_content, recipient),
+                )
+                for recipient in chunk
+            ]
+            return await asyncio.to_thread(self._email_service.send_bulk_email, messages)
 
         for i in range(0, len(recipients), EMAIL_BATCH_SIZE):
             if cancel_event.is_set():
@@ -845,16 +834,20 @@ class EmailBroadcastService:
                 return sent_count, failed_count, True
 
             batch = recipients[i : i + EMAIL_BATCH_SIZE]
-            tasks = [send_single_email(r) for r in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if result is True:
-                    sent_count += 1
-                elif result is None:
-                    pass  # Cancelled or skipped
-                else:
-                    failed_count += 1
+            chunk_size = math.ceil(len(batch) / EMAIL_RATE_LIMIT)
+            chunks = [batch[j : j + chunk_size] for j in range(0, len(batch), chunk_size)]
+            results = await asyncio.gather(*(send_chunk(c) for c in chunks), return_exceptions=True)
+
+            for chunk, result in zip(chunks, results, strict=True):
+                if result is None:
+                    continue  # Cancelled or skipped
+                if isinstance(result, BaseException):
+                    logger.error('Ошибка отправки email рассылки', broadcast_id=broadcast_id, exc=result)
+                    failed_count += len(chunk)
+                    continue
+                sent = sum(result)
+                sent_count += sent
+                failed_count += len(chunk) - sent
 
             # Обновляем прогресс периодически
             processed = sent_count + failed_count
@@ -2353,7 +2353,7 @@ class RemnaWaveService:
             logger.error('Ошибка получения статистики использования ноды', node_uuid=node_uuid, error=e)
             return []
 
-    async def get_node_statistics(self, node_uuid: str) -> dict[str, Any] | None:
+    async def get_node_statistics(self, node_uuid: str, include_history: bool = True) -> dict[str, Any] | None:
         try:
             node = await self.get_node_details(node_uuid)
             if not node:
@@ -2367,10 +2367,12 @@ class RemnaWaveService:
                     node_realtime = stats
                     break
 
-            end_date = datetime.now(UTC)
-            start_date = end_date - timedelta(days=7)
+            usage_history = []
+            if include_history:
+                end_date = datetime.now(UTC)
+                start_date = end_date - timedelta(days=7)
 
-            usage_history = await self.get_node_user_usage_by_range(node_uuid, start_date, end_date)
+                usage_history = await self.get_node_user_usage_by_range(node_uuid, start_date, end_date)
 
             return {
                 'node': node,
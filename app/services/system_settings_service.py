@@ -1594,6 +1594,10 @@ class BotConfigurationService:
                 refresh_period_prices()
             elif key.startswith('PRICE_TRAFFIC_') or key == 'TRAFFIC_PACKAGES_CONFIG':
                 refresh_traffic_prices()
+            elif key.startswith('OAUTH_'):
+                from app.cabinet.auth.oauth_providers import reset_providers_cache
+
+                reset_providers_cache()
             elif key in {'REMNAWAVE_AUTO_SYNC_ENABLED', 'REMNAWAVE_AUTO_SYNC_TIMES'}:
                 try:
                     from app.services.remnawave_sync_service import remnawave_sync_service
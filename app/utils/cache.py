@@ -82,6 +82,20 @@ class CacheService:
             logger.error('Ошибка setnx в кеш', key=key, error=e)
             return False
 
+    async def getdel(self, key: str) -> Any | None:
+        """Атомарно получить значение и удалить ключ (GETDEL)."""
+        if not self._connected:
+            return None
+
+        try:
+            value = await self.redis_client.getdel(key)
+            if value:
+                return json.loads(value)
+            return None
+        except Exception as e:
+            logger.error('Ошибка getdel из кеша', key=key, error=e)
+            return None
+
     async def delete(self, key: str) -> bool:
         if not self._connected:
             return False
@@ -238,6 +252,39 @@ class CacheService:
             logger.error('Ошибка чтения очереди', key=key, error=e)
             return []
 
+    async def lpush_capped(self, key: str, value: Any, max_length: int, expire: int | None = None) -> bool:
+        """Добавить элемент в начало списка, обрезав его до max_length элементов."""
+        if not self._connected:
+            return False
+
+        try:
+            serialized = json.dumps(value, default=str)
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.lpush(key, serialized)
+                pipe.ltrim(key, 0, max_length - 1)
+                if expire:
+                    pipe.expire(key, expire)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error('Ошибка добавления в ограниченный список', key=key, error=e)
+            return False
+
+    async def lpop_all(self, key: str) -> list:
+        """Атомарно забрать все элементы списка и удалить его."""
+        if not self._connected:
+            return []
+
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.lrange(key, 0, -1)
+                pipe.delete(key)
+                items, _ = await pipe.execute()
+            return [json.loads(item) for item in items]
+        except Exception as e:
+            logger.error('Ошибка чтения и очистки списка', key=key, error=e)
+            return []
+
 
 cache = CacheService()
 
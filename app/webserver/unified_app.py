@@ -11,7 +11,13 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from urllib.parse import unquote
 
+from app.cabinet.auth.oauth_providers import (
+    close_http_client as close_oauth_http_client,
+    warm_up_http_client as warm_up_oauth_http_client,
+)
 from app.cabinet.routes import router as cabinet_router
+from app.cabinet.routes.media import close_media_bot
+from app.cabinet.services.telegram_api import close_telegram_client
 from app.config import settings
 from app.services.disposable_email_service import disposable_email_service
 from app.services.payment_service import PaymentService
@@ -187,6 +193,23 @@ def create_unified_app(
     async def stop_disposable_email_service() -> None:  # pragma: no cover - event hook
         await disposable_email_service.stop()
 
+    @app.on_event('startup')
+    async def warm_up_oauth_client() -> None:  # pragma: no cover - event hook
+        if settings.is_cabinet_enabled():
+            await warm_up_oauth_http_client()
+
+    @app.on_event('shutdown')
+    async def close_oauth_client() -> None:  # pragma: no cover - event hook
+        await close_oauth_http_client()
+
+    @app.on_event('shutdown')
+    async def close_cabinet_telegram_client() -> None:  # pragma: no cover - event hook
+        await close_telegram_client()
+
+    @app.on_event('shutdown')
+    async def close_cabinet_media_bot() -> None:  # pragma: no cover - event hook
+        await close_media_bot()
+
     miniapp_mounted, miniapp_path = _mount_miniapp_static(app)
 
     unified_health_path = '/health/unified' if settings.is_web_api_enabled() else '/health'
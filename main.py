@@ -947,9 +947,18 @@ async def _send_crash_notification_on_error(error: Exception) -> None:
         print(f'⚠️ Не удалось отправить уведомление о падении: {notify_error}')
 
 
+def _event_loop_factory():
+    """uvloop, если установлен (быстрее стандартного цикла для сетевого I/O)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == '__main__':
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=_event_loop_factory())
     except KeyboardInterrupt:
         print('\n🛑 Бот остановлен пользователем')
     except Exception as e:
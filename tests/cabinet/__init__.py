@@ -0,0 +1 @@
+# Пакет для тестов модуля личного кабинета.
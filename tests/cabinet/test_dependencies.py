@@ -0,0 +1,166 @@
+"""
+Тесты кеширования проверки подписки на канал и флага админа в зависимостях кабинета.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.cabinet import dependencies
+from app.cabinet.auth.jwt_handler import create_access_token
+from app.cabinet.dependencies import (
+    CHANNEL_SUB_CACHE_TTL,
+    CHANNEL_UNSUB_CACHE_TTL,
+    _check_channel_subscription,
+    get_current_admin_user,
+    get_current_cabinet_user,
+)
+from app.config import settings
+from app.utils.cache import cache_key
+
+
+@pytest.fixture(autouse=True)
+def channel_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'CHANNEL_SUB_ID', '-1001234567890', raising=False)
+    monkeypatch.setattr(settings, 'CHANNEL_IS_REQUIRED_SUB', True, raising=False)
+    monkeypatch.setattr(settings, 'ADMIN_IDS', '', raising=False)
+
+
+@pytest.fixture
+def mock_cache():
+    """Мок Redis-кеша зависимостей кабинета."""
+    with patch.object(dependencies, 'cache') as mock:
+        mock.get = AsyncMock(return_value=None)
+        mock.set = AsyncMock(return_value=True)
+        yield mock
+
+
+@pytest.fixture
+def mock_bot():
+    """Мок бота для запроса статуса участника канала."""
+    bot = MagicMock()
+    bot.get_chat_member = AsyncMock(return_value=SimpleNamespace(status='member'))
+    with patch.object(dependencies, '_get_channel_check_bot', return_value=bot):
+        yield bot
+
+
+# ============== Кеш проверки подписки ==============
+
+
+async def test_cached_result_skips_bot_api(mock_cache, mock_bot):
+    """Закешированный результат возвращается без запроса к Bot API."""
+    mock_cache.get = AsyncMock(return_value=False)
+
+    assert await _check_channel_subscription(42) is False
+
+    mock_cache.get.assert_awaited_once_with(cache_key('channel_sub', 42))
+    mock_bot.get_chat_member.assert_not_called()
+    mock_cache.set.assert_not_called()
+
+
+async def test_subscribed_result_cached_for_long_ttl(mock_cache, mock_bot):
+    """Подписка кешируется на CHANNEL_SUB_CACHE_TTL (300 секунд)."""
+    assert await _check_channel_subscription(42) is True
+
+    mock_bot.get_chat_member.assert_awaited_once()
+    mock_cache.set.assert_awaited_once_with(cache_key('channel_sub', 42), True, expire=CHANNEL_SUB_CACHE_TTL)
+    assert CHANNEL_SUB_CACHE_TTL == 300
+
+
+async def test_unsubscribed_result_cached_for_short_ttl(mock_cache, mock_bot):
+    """Отсутствие подписки кешируется на CHANNEL_UNSUB_CACHE_TTL (30 секунд)."""
+    mock_bot.get_chat_member = AsyncMock(return_value=SimpleNamespace(status='left'))
+
+    assert await _check_channel_subscription(42) is False
+
+    mock_cache.set.assert_awaited_once_with(cache_key('channel_sub', 42), False, expire=CHANNEL_UNSUB_CACHE_TTL)
+    assert CHANNEL_UNSUB_CACHE_TTL == 30
+
+
+async def test_bot_api_error_is_not_cached(mock_cache, mock_bot):
+    """Ошибка Bot API не блокирует пользователя и не попадает в кеш."""
+    mock_bot.get_chat_member = AsyncMock(side_effect=RuntimeError('boom'))
+
+    assert await _check_channel_subscription(42) is True
+
+    mock_cache.set.assert_not_called()
+
+
+async def test_concurrent_checks_share_single_request(mock_cache, mock_bot):
+    """Параллельные проверки одного пользователя объединяются в один запрос к Bot API."""
+    release = asyncio.Event()
+
+    async def slow_get_chat_member(**kwargs):
+        await release.wait()
+        return SimpleNamespace(status='member')
+
+    mock_bot.get_chat_member = AsyncMock(side_effect=slow_get_chat_member)
+
+    callers = [asyncio.create_task(_check_channel_subscription(42)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert list(dependencies._inflight_channel_checks) == [42]
+
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert results == [True] * 5
+    mock_bot.get_chat_member.assert_awaited_once()
+    mock_cache.set.assert_awaited_once()
+    assert dependencies._inflight_channel_checks == {}
+
+
+# ============== Флаг админа в request.state ==============
+
+
+def _make_user(telegram_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1,
+        telegram_id=telegram_id,
+        username=None,
+        email=None,
+        email_verified=False,
+        status='active',
+    )
+
+
+async def _resolve_cabinet_user(user: SimpleNamespace) -> SimpleNamespace:
+    request = SimpleNamespace(state=SimpleNamespace())
+    credentials = HTTPAuthorizationCredentials(scheme='Bearer', credentials=create_access_token(user.id))
+    with (
+        patch.object(dependencies, 'get_user_by_id', AsyncMock(return_value=user)),
+        patch.object(dependencies.blacklist_service, 'is_user_blacklisted', AsyncMock(return_value=(False, None))),
+        patch.object(dependencies.maintenance_service, 'is_maintenance_active', return_value=False),
+    ):
+        assert await get_current_cabinet_user(request, credentials, db=None) is user
+    return request
+
+
+async def test_admin_flag_stored_and_channel_check_skipped(monkeypatch, mock_cache, mock_bot):
+    """Админ получает cabinet_is_admin=True и не проходит проверку подписки."""
+    monkeypatch.setattr(settings, 'ADMIN_IDS', '777', raising=False)
+    user = _make_user(777)
+
+    request = await _resolve_cabinet_user(user)
+
+    assert request.state.cabinet_is_admin is True
+    mock_bot.get_chat_member.assert_not_called()
+    assert await get_current_admin_user(request, user) is user
+
+
+async def test_admin_dependency_reuses_request_flag(mock_cache, mock_bot):
+    """get_current_admin_user берёт флаг из request.state, не пересчитывая его."""
+    user = _make_user(555)
+
+    request = await _resolve_cabinet_user(user)
+
+    assert request.state.cabinet_is_admin is False
+    mock_bot.get_chat_member.assert_awaited_once()
+    with patch.object(dependencies, '_is_cabinet_admin') as is_cabinet_admin:
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_admin_user(request, user)
+    assert exc_info.value.status_code == 403
+    is_cabinet_admin.assert_not_called()
@@ -0,0 +1,189 @@
+"""
+Тесты пула SMTP-соединений и пакетной отправки писем.
+"""
+
+import smtplib
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.cabinet.services.email_service import EmailService
+from app.config import settings
+
+
+# app.cabinet.services реэкспортирует экземпляр email_service, перекрывающий имя модуля
+email_service_module = sys.modules[EmailService.__module__]
+
+
+@pytest.fixture(autouse=True)
+def smtp_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'SMTP_HOST', 'smtp.example.com', raising=False)
+    monkeypatch.setattr(settings, 'SMTP_PORT', 25, raising=False)
+    monkeypatch.setattr(settings, 'SMTP_USER', None, raising=False)
+    monkeypatch.setattr(settings, 'SMTP_PASSWORD', None, raising=False)
+    monkeypatch.setattr(settings, 'SMTP_FROM_EMAIL', 'noreply@example.com', raising=False)
+    monkeypatch.setattr(settings, 'SMTP_USE_TLS', False, raising=False)
+    monkeypatch.setattr(settings, 'SMTP_POOL_SIZE', 4, raising=False)
+    monkeypatch.setattr(settings, 'SMTP_POOL_IDLE_SECONDS', 60, raising=False)
+
+
+@pytest.fixture
+def smtp_factory():
+    """Мок smtplib.SMTP: каждое подключение - отдельный MagicMock с успешным NOOP."""
+    connections: list[MagicMock] = []
+
+    def _connect(host, port):
+        smtp = MagicMock(name=f'smtp{len(connections)}')
+        smtp.noop.return_value = (250, b'OK')
+        connections.append(smtp)
+        return smtp
+
+    with patch.object(email_service_module.smtplib, 'SMTP', side_effect=_connect) as factory:
+        factory.connections = connections
+        yield factory
+
+
+@pytest.fixture
+def clock():
+    """Управляемые часы для проверки времени простоя соединений в пуле."""
+    with patch.object(email_service_module.time, 'monotonic', return_value=1000.0) as monotonic:
+        yield monotonic
+
+
+# ============== Пул соединений ==============
+
+
+def test_connection_reused_between_emails(smtp_factory, clock):
+    """Второе письмо уходит через то же соединение после проверки NOOP."""
+    service = EmailService()
+
+    assert service.send_email('a@example.com', 'Hi', '<p>Hi</p>') is True
+    assert service.send_email('b@example.com', 'Hi', '<p>Hi</p>') is True
+
+    assert smtp_factory.call_count == 1
+    smtp = smtp_factory.connections[0]
+    assert smtp.send_message.call_count == 2
+    smtp.noop.assert_called_once()
+    smtp.quit.assert_not_called()
+
+
+def test_failed_noop_replaces_connection(smtp_factory, clock):
+    """Соединение, не ответившее на NOOP, закрывается и заменяется новым."""
+    service = EmailService()
+    service.send_email('a@example.com', 'Hi', '<p>Hi</p>')
+    stale = smtp_factory.connections[0]
+    stale.noop.side_effect = smtplib.SMTPServerDisconnected('gone')
+
+    assert service.send_email('b@example.com', 'Hi', '<p>Hi</p>') is True
+
+    assert smtp_factory.call_count == 2
+    stale.quit.assert_called_once()
+    smtp_factory.connections[1].send_message.assert_called_once()
+
+
+def test_idle_connection_evicted(smtp_factory, clock):
+    """Соединение, простаивавшее дольше SMTP_POOL_IDLE_SECONDS, закрывается без NOOP."""
+    service = EmailService()
+    service.send_email('a@example.com', 'Hi', '<p>Hi</p>')
+    stale = smtp_factory.connections[0]
+
+    clock.return_value += settings.SMTP_POOL_IDLE_SECONDS + 1
+    assert service.send_email('b@example.com', 'Hi', '<p>Hi</p>') is True
+
+    assert smtp_factory.call_count == 2
+    stale.noop.assert_not_called()
+    stale.quit.assert_called_once()
+
+
+def test_pool_disabled_closes_connection(monkeypatch, smtp_factory, clock):
+    """При SMTP_POOL_SIZE=0 соединение закрывается после каждого письма."""
+    monkeypatch.setattr(settings, 'SMTP_POOL_SIZE', 0, raising=False)
+    service = EmailService()
+
+    service.send_email('a@example.com', 'Hi', '<p>Hi</p>')
+
+    smtp_factory.connections[0].quit.assert_called_once()
+    assert service._pool == []
+
+
+# ============== Пакетная отправка ==============
+
+
+def test_bulk_rejected_recipient_keeps_connection(smtp_factory, clock):
+    """Отклонённый получатель не обрывает пакет и не закрывает соединение."""
+    service = EmailService()
+
+    def _send(msg):
+        if msg['To'] == 'bad@example.com':
+            raise smtplib.SMTPRecipientsRefused({'bad@example.com': (550, b'No such user')})
+
+    smtp_factory.side_effect = None
+    smtp = MagicMock()
+    smtp.send_message.side_effect = _send
+    smtp_factory.return_value = smtp
+
+    results = service.send_bulk_email(
+        [
+            ('a@example.com', 'Hi', '<p>Hi</p>'),
+            ('bad@example.com', 'Hi', '<p>Hi</p>'),
+            ('c@example.com', 'Hi', '<p>Hi</p>'),
+        ]
+    )
+
+    assert results == [True, False, True]
+    assert smtp_factory.call_count == 1
+    assert smtp.send_message.call_count == 3
+    smtp.quit.assert_not_called()
+    assert [conn for conn, _ in service._pool] == [smtp]
+
+
+def test_bulk_421_mid_batch_replaces_connection(smtp_factory, clock):
+    """Ответ 421 закрывает сессию: письмо считается неотправленным, пакет идёт через новое соединение."""
+    service = EmailService()
+    throttled = MagicMock()
+
+    def _send(msg):
+        if msg['To'] == 'b@example.com':
+            # smtplib.sendmail вызывает close() перед тем как поднять исключение на 421
+            throttled.sock = None
+            raise smtplib.SMTPDataError(421, b'Too many messages')
+
+    throttled.send_message.side_effect = _send
+    fresh = MagicMock()
+    smtp_factory.side_effect = [throttled, fresh]
+
+    results = service.send_bulk_email(
+        [
+            ('a@example.com', 'Hi', '<p>Hi</p>'),
+            ('b@example.com', 'Hi', '<p>Hi</p>'),
+            ('c@example.com', 'Hi', '<p>Hi</p>'),
+        ]
+    )
+
+    assert results == [True, False, True]
+    assert smtp_factory.call_count == 2
+    fresh.send_message.assert_called_once()
+    assert [conn for conn, _ in service._pool] == [fresh]
+
+
+def test_bulk_broken_connection_is_replaced(smtp_factory, clock):
+    """Обрыв соединения проваливает только текущее письмо, дальше пакет идёт через новое."""
+    service = EmailService()
+    broken = MagicMock()
+    broken.send_message.side_effect = [None, smtplib.SMTPServerDisconnected('gone')]
+    fresh = MagicMock()
+    smtp_factory.side_effect = [broken, fresh]
+
+    results = service.send_bulk_email(
+        [
+            ('a@example.com', 'Hi', '<p>Hi</p>'),
+            ('b@example.com', 'Hi', '<p>Hi</p>'),
+            ('c@example.com', 'Hi', '<p>Hi</p>'),
+        ]
+    )
+
+    assert results == [True, False, True]
+    broken.quit.assert_called_once()
+    fresh.send_message.assert_called_once()
+    assert [conn for conn, _ in service._pool] == [fresh]
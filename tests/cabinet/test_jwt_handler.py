@@ -0,0 +1,56 @@
+"""
+Тесты разбора JWT-токенов кабинета.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import jwt
+
+from app.cabinet.auth.jwt_handler import (
+    JWT_ALGORITHM,
+    create_access_token,
+    create_refresh_token,
+    get_token_payload,
+)
+from app.config import settings
+
+
+def _encode(payload: dict) -> str:
+    return jwt.encode(payload, settings.get_cabinet_jwt_secret(), algorithm=JWT_ALGORITHM)
+
+
+def test_valid_access_token_parses_sub_to_int():
+    """sub из валидного токена приводится к int, telegram_id сохраняется."""
+    payload = get_token_payload(create_access_token(123, telegram_id=456))
+
+    assert payload is not None
+    assert payload['sub'] == 123
+    assert isinstance(payload['sub'], int)
+    assert payload['type'] == 'access'
+    assert payload['telegram_id'] == 456
+
+
+def test_token_of_other_type_is_rejected():
+    """Refresh-токен не принимается там, где ожидается access."""
+    token = create_refresh_token(123)
+
+    assert get_token_payload(token, expected_type='access') is None
+    assert get_token_payload(token, expected_type='refresh')['sub'] == 123
+
+
+def test_non_numeric_sub_is_rejected():
+    """Токен с нечисловым sub считается невалидным."""
+    now = datetime.now(UTC)
+    token = _encode({'sub': 'abc', 'type': 'access', 'exp': now + timedelta(minutes=5), 'iat': now})
+
+    assert get_token_payload(token) is None
+
+
+def test_expired_token_is_rejected():
+    """Просроченный токен считается невалидным."""
+    now = datetime.now(UTC)
+    token = _encode(
+        {'sub': '123', 'type': 'access', 'exp': now - timedelta(minutes=1), 'iat': now - timedelta(hours=1)}
+    )
+
+    assert get_token_payload(token) is None